@@ -25,31 +25,40 @@ matplotlib.use("TkAgg")  # Set Matplotlib backend to TkAgg for interactive plott
 import click
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import matplotlib.pyplot as plt
 import numpy as np
 import json
+import sys
 import warnings
-import uuid
-from datetime import datetime
-from typing import Optional, Dict, Tuple, Union
-from tqdm import tqdm
-from qiskit import QuantumCircuit
-from qiskit.quantum_info import DensityMatrix
-from src.run_experiment import run_experiment
-from src.utils import logger, results as ExperimentUtils
+from uuid import uuid4
+import time
+from typing import TYPE_CHECKING, Any, Optional, Dict, List, Tuple, Union
+from src.run_experiment import run_experiment, run_experiment_batch
+from src.utils import (
+    logger,
+    results as ExperimentUtils,
+    serialization,
+    experiment_cache,
+)
 from src.utils.input_handler import InputHandler
 from src.visualization.visualization_handler import handle_visualization
 from src.config.params import apply_defaults, validate_parameters
 from src.config.constants import (
     VALID_NOISE_TYPES,
     VALID_STATE_TYPES,
+    VALID_SIM_MODES,
     NOISE_SHORTCUTS,
     SINGLE_QUBIT_NOISE_TYPES,
 )
 from src.config.defaults import DEFAULT_ERROR_RATE
 from src.noise_models.noise_factory import NOISE_CLASSES
-from src.utils.messages import MESSAGES  # Import the messages lookup table
+from src.utils.messages import (  # Import the messages lookup table
+    MESSAGES,
+    COMPILED_MESSAGES,
+)
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import DensityMatrix
 
 # Suppress Qiskit deprecation warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -60,12 +69,89 @@ logger_instance = logger.setup_logger(
     log_to_file=True,
     log_to_console=True,
     structured_log_file="logs/structured_logs.json",
+    buffer_capacity=1024,
 )
 
 # Initialize Rich console and input handler
 console = Console()
 input_handler = InputHandler(console, MESSAGES)
 
+# Visualization and time-stepping keys that are not run_experiment() arguments
+_NON_EXPERIMENT_KEYS = frozenset(
+    {
+        "visualization_type",
+        "save_plot",
+        "min_occurrences",
+        "show_real",
+        "show_imag",
+        "hypergraph_config",
+        "time_steps",
+        "noise_stepped",
+        "noise_start",
+        "noise_end",
+        "noise_steps",
+        "z_prob_start",
+        "z_prob_end",
+        "i_prob_start",
+        "i_prob_end",
+        "t1_start",
+        "t1_end",
+        "t2_start",
+        "t2_end",
+    }
+)
+
+# Multi-qubit noise types offered when switching away from single-qubit noise
+_NOISE_ALIAS_MAP = {
+    "d": "DEPOLARIZING",
+    "p": "PHASE_FLIP",
+    "t": "THERMAL_RELAXATION",
+    "depolarizing": "DEPOLARIZING",
+    "phase_flip": "PHASE_FLIP",
+    "thermal_relaxation": "THERMAL_RELAXATION",
+}
+
+# Accepted simulation mode and visualization answers, normalized to canonical names
+_SIM_MODE_MAP = {"q": "qasm", "qasm": "qasm", "d": "density", "density": "density"}
+_VIZ_CHOICE_MAP = {"p": "plot", "plot": "plot", "h": "hypergraph", "hypergraph": "hypergraph"}
+
+# Hash of the parameters last returned by validate_and_prompt
+_last_validated_hash: Optional[int] = None
+
+# (label, args key, value shown when unset) rows of the parameter summary table
+_PARAM_SCHEMA: List[Tuple[str, str, Any]] = [
+    ("Number of Qubits", "num_qubits", None),
+    ("State Type", "state_type", None),
+    ("Noise Type", "noise_type", None),
+    ("Noise Enabled", "noise_enabled", None),
+    ("Shots", "shots", None),
+    ("Simulation Mode", "sim_mode", None),
+    ("Error Rate", "error_rate", "Default"),
+    ("Z Probability", "z_prob", "Default"),
+    ("I Probability", "i_prob", "Default"),
+    ("T1", "t1", "Default"),
+    ("T2", "t2", "Default"),
+]
+_STEPPED_PARAM_SCHEMA: List[Tuple[str, str, Any]] = [
+    ("Noise Start", "noise_start", 0.0),
+    ("Noise End", "noise_end", 0.5),
+    ("Noise Steps", "noise_steps", 10),
+]
+# (label prefix, args key prefix) of optional stepped start/end ranges
+_STEPPED_RANGE_SCHEMA: List[Tuple[str, str]] = [
+    ("Z Prob", "z_prob"),
+    ("I Prob", "i_prob"),
+    ("T1", "t1"),
+    ("T2", "t2"),
+]
+
+
+def _new_id() -> str:
+    """
+    Returns a new experiment identifier.
+    """
+    return uuid4().hex
+
 
 def print_message(key: str, **kwargs) -> None:
     """
@@ -75,8 +161,13 @@ def print_message(key: str, **kwargs) -> None:
         key (str): The key to look up the message in MESSAGES.
         **kwargs: Values to format the message with (e.g., noise_type, num_qubits).
     """
-    message = MESSAGES.get(key, f"[bold red]Missing prompt for key: {key}[/bold red]")
-    console.print(message.format(**kwargs))
+    try:
+        message = COMPILED_MESSAGES[key](kwargs)
+    except KeyError:
+        message = MESSAGES.get(
+            key, f"[bold red]Missing prompt for key: {key}[/bold red]"
+        ).format(**kwargs)
+    console.print(message)
 
 
 def show_plot_nonblocking(visualizer_method, *args, **kwargs) -> bool:
@@ -91,10 +182,14 @@ def show_plot_nonblocking(visualizer_method, *args, **kwargs) -> bool:
     Returns:
         bool: True if closed with Enter, False if closed with Ctrl+C.
     """
+    import matplotlib.pyplot as plt  # Deferred until a plot is actually shown
+
     plt.ion()  # Enable interactive mode
     visualizer_method(*args, **kwargs)
-    plt.draw()  # Draw the plot
-    plt.pause(0.1)  # Brief pause to show plot
+    fig = plt.gcf()
+    plt.show(block=False)  # Make sure the window is mapped
+    fig.canvas.draw_idle()  # Schedule a redraw without spinning the event loop
+    fig.canvas.flush_events()  # Process pending GUI events so the plot appears
     try:
         input("Press Enter or Ctrl+C to continue...")
         plt.close()  # Close plot
@@ -111,33 +206,11 @@ def format_params(args: Dict) -> str:
     """
     Formats experiment parameters for display, excluding visualization keys.
     """
-    params = {
-        k: v
+    return ", ".join(
+        f"{k}={v}"
         for k, v in args.items()
-        if k
-        not in [
-            "visualization_type",
-            "save_plot",
-            "min_occurrences",
-            "show_real",
-            "show_imag",
-            "hypergraph_config",
-            "time_steps",
-            "noise_stepped",
-            "noise_start",
-            "noise_end",
-            "noise_steps",
-            "z_prob_start",
-            "z_prob_end",
-            "i_prob_start",
-            "i_prob_end",
-            "t1_start",
-            "t1_end",
-            "t2_start",
-            "t2_end",
-        ]
-    }
-    return ", ".join(f"{k}={v}" for k, v in params.items() if v is not None)
+        if k not in _NON_EXPERIMENT_KEYS and v is not None
+    )
 
 
 def display_params_summary(args: Dict) -> None:
@@ -149,45 +222,19 @@ def display_params_summary(args: Dict) -> None:
     )
     table.add_column("Parameter", style="cyan")
     table.add_column("Value", style="green")
-    params_to_display = {
-        "Number of Qubits": args["num_qubits"],
-        "State Type": args["state_type"],
-        "Noise Type": args["noise_type"],
-        "Noise Enabled": args["noise_enabled"],
-        "Shots": args["shots"],
-        "Simulation Mode": args["sim_mode"],
-        "Error Rate": (
-            args["error_rate"] if args["error_rate"] is not None else "Default"
-        ),
-        "Z Probability": args["z_prob"] if args["z_prob"] is not None else "Default",
-        "I Probability": args["i_prob"] if args["i_prob"] is not None else "Default",
-        "T1": args["t1"] if args["t1"] is not None else "Default",
-        "T2": args["t2"] if args["t2"] is not None else "Default",
-        "Custom Params": args["custom_params"] if args["custom_params"] else "None",
-    }
+    for label, key, default in _PARAM_SCHEMA:
+        value = args.get(key)
+        table.add_row(label, str(default if value is None else value))
+    table.add_row("Custom Params", str(args.get("custom_params") or "None"))
     if args.get("noise_stepped", False):
-        params_to_display.update(
-            {
-                "Noise Stepped": "Yes",
-                "Noise Start": args.get("noise_start", 0.0),
-                "Noise End": args.get("noise_end", 0.5),
-                "Noise Steps": args.get("noise_steps", 10),
-            }
-        )
-        if "z_prob_start" in args:
-            params_to_display["Z Prob Start"] = args["z_prob_start"]
-            params_to_display["Z Prob End"] = args["z_prob_end"]
-        if "i_prob_start" in args:
-            params_to_display["I Prob Start"] = args["i_prob_start"]
-            params_to_display["I Prob End"] = args["i_prob_end"]
-        if "t1_start" in args:
-            params_to_display["T1 Start"] = args["t1_start"]
-            params_to_display["T1 End"] = args["t1_end"]
-        if "t2_start" in args:
-            params_to_display["T2 Start"] = args["t2_start"]
-            params_to_display["T2 End"] = args["t2_end"]
-    for param, value in params_to_display.items():
-        table.add_row(param, str(value))
+        table.add_row("Noise Stepped", "Yes")
+        for label, key, default in _STEPPED_PARAM_SCHEMA:
+            value = args.get(key)
+            table.add_row(label, str(default if value is None else value))
+        for label, key in _STEPPED_RANGE_SCHEMA:
+            if f"{key}_start" in args:
+                table.add_row(f"{label} Start", str(args[f"{key}_start"]))
+                table.add_row(f"{label} End", str(args[f"{key}_end"]))
     console.print(table)
 
 
@@ -198,7 +245,7 @@ def switch_to_plot(args: Dict) -> Dict:
     args["visualization_type"] = "plot"
     if args["sim_mode"] == "qasm":
         args["min_occurrences"] = input_handler.get_numeric_input(
-            "min_occurrences_prompt", "0"
+            "min_occurrences_prompt", "0", retry=True
         )
     else:  # density mode
         real_imag = input_handler.get_input("real_imag_prompt", "a", ["r", "i", "a"])
@@ -214,12 +261,9 @@ def collect_core_parameters(args: Dict) -> Dict:
     print_message("enter_parameters")
 
     # Collect number of qubits
-    try:
-        args["num_qubits"] = input_handler.get_numeric_input(
-            "num_qubits_prompt", str(args["num_qubits"])
-        )
-    except ValueError:
-        return collect_parameters(interactive=True)
+    args["num_qubits"] = input_handler.get_numeric_input(
+        "num_qubits_prompt", str(args["num_qubits"]), retry=True
+    )
 
     # Collect noise type with shortcuts and auto-correction
     noise_input = input_handler.get_input(
@@ -228,15 +272,18 @@ def collect_core_parameters(args: Dict) -> Dict:
         valid_options=VALID_NOISE_TYPES + ["d", "p", "a", "z", "t", "b"],
         valid_options_display=VALID_NOISE_TYPES,
     )
-    args["noise_type"] = noise_input.upper()
+    # Interned so later comparisons against the type constants hit the identity fast path
+    args["noise_type"] = sys.intern(noise_input.upper())
     args["noise_type"] = NOISE_SHORTCUTS.get(noise_input, args["noise_type"])
 
     # Collect state type
-    args["state_type"] = input_handler.get_input(
-        "state_type_prompt",
-        default=args["state_type"].lower(),
-        valid_options=VALID_STATE_TYPES,
-    ).upper()
+    args["state_type"] = sys.intern(
+        input_handler.get_input(
+            "state_type_prompt",
+            default=args["state_type"].lower(),
+            valid_options=VALID_STATE_TYPES,
+        ).upper()
+    )
 
     # Collect noise enabled
     args["noise_enabled"] = input_handler.get_input(
@@ -251,23 +298,12 @@ def collect_core_parameters(args: Dict) -> Dict:
         default=args["sim_mode"].lower(),
         valid_options=["q", "d", "qasm", "density"],
     )
-    args["sim_mode"] = (
-        "qasm"
-        if args["sim_mode"] in ["q", "qasm"]
-        else (
-            "density"
-            if args["sim_mode"] in ["d", "density"]
-            else args["sim_mode"].lower()
-        )
-    )
+    args["sim_mode"] = _SIM_MODE_MAP.get(args["sim_mode"], args["sim_mode"].lower())
 
     # Collect shots
-    try:
-        args["shots"] = input_handler.get_numeric_input(
-            "shots_prompt", str(args["shots"])
-        )
-    except ValueError:
-        return collect_parameters(interactive=True)
+    args["shots"] = input_handler.get_numeric_input(
+        "shots_prompt", str(args["shots"]), retry=True
+    )
 
     return args
 
@@ -288,48 +324,60 @@ def collect_stepped_noise_parameters(args: Dict) -> Dict:
 
     # Collect number of steps
     args["noise_steps"] = input_handler.get_numeric_input(
-        "noise_steps_prompt", "10", int
+        "noise_steps_prompt", "10", int, retry=True
     )
 
     # Collect stepped parameters for error_rate
     if input_handler.prompt_yes_no("custom_error_rate_stepped_prompt", default="y"):
         args["noise_start"] = input_handler.get_numeric_input(
-            "noise_start_prompt", "0.0", float
+            "noise_start_prompt", "0.0", float, retry=True
         )
         args["noise_end"] = input_handler.get_numeric_input(
-            "noise_end_prompt", "0.5", float
+            "noise_end_prompt", "0.5", float, retry=True
         )
 
     # Collect stepped parameters for DEPOLARIZING noise (skip for PHASE_FLIP and BIT_FLIP)
     if args["noise_type"] == "DEPOLARIZING":
         if input_handler.prompt_yes_no("custom_zi_probs_stepped_prompt", default="n"):
             args["z_prob_start"] = input_handler.get_numeric_input(
-                "z_prob_start_prompt", "0.0", float
+                "z_prob_start_prompt", "0.0", float, retry=True
             )
             args["z_prob_end"] = input_handler.get_numeric_input(
-                "z_prob_end_prompt", "0.5", float
+                "z_prob_end_prompt", "0.5", float, retry=True
             )
             args["i_prob_start"] = input_handler.get_numeric_input(
-                "i_prob_start_prompt", "0.0", float
+                "i_prob_start_prompt", "0.0", float, retry=True
             )
             args["i_prob_end"] = input_handler.get_numeric_input(
-                "i_prob_end_prompt", "0.5", float
+                "i_prob_end_prompt", "0.5", float, retry=True
             )
 
     # Collect stepped parameters for THERMAL_RELAXATION noise
     if args["noise_type"] == "THERMAL_RELAXATION":
         if input_handler.prompt_yes_no("custom_t1t2_stepped_prompt", default="n"):
             args["t1_start"] = (
-                input_handler.get_numeric_input("t1_start_prompt", "100", float) * 1e-6
+                input_handler.get_numeric_input(
+                    "t1_start_prompt", "100", float, retry=True
+                )
+                * 1e-6
             )
             args["t1_end"] = (
-                input_handler.get_numeric_input("t1_end_prompt", "50", float) * 1e-6
+                input_handler.get_numeric_input(
+                    "t1_end_prompt", "50", float, retry=True
+                )
+                * 1e-6
             )
             args["t2_start"] = (
-                input_handler.get_numeric_input("t2_start_prompt", "80", float) * 1e-6
+                input_handler.get_numeric_input(
+                    "t2_start_prompt", "80", float, retry=True
+                )
+                * 1e-6
             )
             args["t2_end"] = (
-                input_handler.get_numeric_input("t2_end_prompt", "40", float) * 1e-6
+                input_handler.get_numeric_input(
+                    "t2_end_prompt", "40", float, retry=True
+                )
+                * 1e-6
             )
 
     return args
@@ -343,31 +391,27 @@ def collect_visualization_settings(args: Dict) -> Dict:
     viz_choice = input_handler.get_input(
         "viz_type_prompt", default="n", valid_options=["p", "h", "n"]
     )
-    args["visualization_type"] = (
-        "plot"
-        if viz_choice in ["p", "plot"]
-        else "hypergraph" if viz_choice in ["h", "hypergraph"] else "none"
-    )
+    args["visualization_type"] = _VIZ_CHOICE_MAP.get(viz_choice, "none")
     if args["visualization_type"] != "none":
         args["save_plot"] = (
-            input_handler.get_input("save_plot_prompt", default="").strip() or None
+            input_handler.get_input_free("save_plot_prompt", default="").strip() or None
         )
         if args["visualization_type"] == "plot" and args["sim_mode"] == "qasm":
             args["min_occurrences"] = input_handler.get_numeric_input(
-                "min_occurrences_prompt", "0"
+                "min_occurrences_prompt", "0", retry=True
             )
 
     # Hypergraph-specific settings
     if args["visualization_type"] == "hypergraph":
         args["hypergraph_config"] = {}
         max_order = input_handler.get_numeric_input(
-            "hypergraph_max_order_prompt", "2", int
+            "hypergraph_max_order_prompt", "2", int, retry=True
         )
         args["hypergraph_config"]["max_order"] = max_order
 
         default_threshold = "0.1" if args["sim_mode"] == "qasm" else "0.01"
         threshold = input_handler.get_numeric_input(
-            "hypergraph_threshold_prompt", default_threshold, float
+            "hypergraph_threshold_prompt", default_threshold, float, retry=True
         )
         args["hypergraph_config"]["threshold"] = threshold
 
@@ -397,25 +441,31 @@ def collect_optional_parameters(args: Dict) -> Dict:
     # Optional parameters with confirmation
     if input_handler.prompt_yes_no("custom_error_rate_prompt", default="n"):
         args["error_rate"] = input_handler.get_numeric_input(
-            "error_rate_value_prompt", str(DEFAULT_ERROR_RATE), float
+            "error_rate_value_prompt", str(DEFAULT_ERROR_RATE), float, retry=True
         )
     if args["noise_type"] == "PHASE_FLIP" and input_handler.prompt_yes_no(
         "custom_zi_probs_prompt", default="n"
     ):
         args["z_prob"] = input_handler.get_numeric_input(
-            "z_prob_value_prompt", "0.5", float
+            "z_prob_value_prompt", "0.5", float, retry=True
         )
         args["i_prob"] = input_handler.get_numeric_input(
-            "i_prob_value_prompt", "0.5", float
+            "i_prob_value_prompt", "0.5", float, retry=True
         )
     if args["noise_type"] == "THERMAL_RELAXATION" and input_handler.prompt_yes_no(
         "custom_t1t2_prompt", default="n"
     ):
         args["t1"] = (
-            input_handler.get_numeric_input("t1_value_prompt", "100", float) * 1e-6
+            input_handler.get_numeric_input(
+                "t1_value_prompt", "100", float, retry=True
+            )
+            * 1e-6
         )
         args["t2"] = (
-            input_handler.get_numeric_input("t2_value_prompt", "80", float) * 1e-6
+            input_handler.get_numeric_input(
+                "t2_value_prompt", "80", float, retry=True
+            )
+            * 1e-6
         )
     if args["state_type"] == "CLUSTER" and input_handler.prompt_yes_no(
         "custom_lattice_prompt", default="n"
@@ -427,25 +477,73 @@ def collect_optional_parameters(args: Dict) -> Dict:
         )
         args["custom_params"]["lattice"] = lattice_type
     if input_handler.prompt_yes_no("custom_params_prompt", default="n"):
-        custom_params_str = input_handler.get_input(
-            "custom_params_value_prompt", default=""
-        ).strip()
-        try:
-            args["custom_params"] = (
-                json.loads(custom_params_str) if custom_params_str else None
-            )
-        except json.JSONDecodeError:
-            print_message(
-                "invalid_input", input="custom params", options=["valid JSON"]
-            )
-            return collect_parameters(interactive=True)
+        while True:
+            custom_params_str = input_handler.get_input_free(
+                "custom_params_value_prompt", default=""
+            ).strip()
+            try:
+                args["custom_params"] = (
+                    serialization.loads(custom_params_str)
+                    if custom_params_str
+                    else None
+                )
+                break
+            except json.JSONDecodeError:
+                print_message(
+                    "invalid_input", input="custom params", options=["valid JSON"]
+                )
+
+    return args
+
 
+def _prompt_replacement_noise(args: Dict) -> Dict:
+    """
+    Prompts the user for a multi-qubit noise type to switch to.
+    """
+    print_message("suggested_multi_qubit_noise_types")
+    new_noise = input_handler.get_input(
+        "noise_type_prompt",
+        "depolarizing",
+        valid_options=list(_NOISE_ALIAS_MAP),
+    )
+    args["noise_type"] = _NOISE_ALIAS_MAP[new_noise]
+    print_message("switched_noise_type", noise_type=args["noise_type"])
     return args
 
 
+def _args_hash(args: Dict) -> int:
+    """
+    Hashes a parameter set by its keys and printed values.
+    """
+    return hash(tuple(sorted((k, str(v)) for k, v in args.items())))
+
+
 def validate_and_prompt(args: Dict) -> Dict:
     """
     Validates parameters and prompts the user for adjustments if needed.
+
+    A parameter set identical to the last one that passed through here is returned
+    unchanged, so rerunning with the same settings does not repeat the warnings.
+    """
+    global _last_validated_hash
+    if _args_hash(args) == _last_validated_hash:
+        return args
+    args = _validate_and_prompt(args)
+    _last_validated_hash = _args_hash(args)
+    return args
+
+
+def _forget_validated_args() -> None:
+    """
+    Makes the next validate_and_prompt call run its checks, e.g. after parameters are discarded.
+    """
+    global _last_validated_hash
+    _last_validated_hash = None
+
+
+def _validate_and_prompt(args: Dict) -> Dict:
+    """
+    Runs the compatibility checks and prompts behind validate_and_prompt.
     """
     # Single-qubit noise with multi-qubit system
     if args["noise_type"] in SINGLE_QUBIT_NOISE_TYPES and args["num_qubits"] > 1:
@@ -453,29 +551,7 @@ def validate_and_prompt(args: Dict) -> Dict:
             "single_qubit_noise_prompt", "p", ["p", "switch", "c"]
         )
         if choice == "switch":
-            print_message("suggested_multi_qubit_noise_types")
-            new_noise = input_handler.get_input(
-                "noise_type_prompt",
-                "depolarizing",
-                valid_options=[
-                    "d",
-                    "p",
-                    "t",
-                    "depolarizing",
-                    "phase_flip",
-                    "thermal_relaxation",
-                ],
-            )
-            args["noise_type"] = (
-                "DEPOLARIZING"
-                if new_noise in ["d", "depolarizing"]
-                else (
-                    "PHASE_FLIP"
-                    if new_noise in ["p", "phase_flip"]
-                    else "THERMAL_RELAXATION"
-                )
-            )
-            print_message("switched_noise_type", noise_type=args["noise_type"])
+            args = _prompt_replacement_noise(args)
         elif choice == "c":
             print_message("config_cancelled")
             return collect_parameters(interactive=True)
@@ -492,29 +568,7 @@ def validate_and_prompt(args: Dict) -> Dict:
                 "hypergraph_single_qubit_prompt", "p", ["p", "switch", "v"]
             )
             if choice == "switch":
-                print_message("suggested_multi_qubit_noise_types")
-                new_noise = input_handler.get_input(
-                    "noise_type_prompt",
-                    "depolarizing",
-                    valid_options=[
-                        "d",
-                        "p",
-                        "t",
-                        "depolarizing",
-                        "phase_flip",
-                        "thermal_relaxation",
-                    ],
-                )
-                args["noise_type"] = (
-                    "DEPOLARIZING"
-                    if new_noise in ["d", "depolarizing"]
-                    else (
-                        "PHASE_FLIP"
-                        if new_noise in ["p", "phase_flip"]
-                        else "THERMAL_RELAXATION"
-                    )
-                )
-                print_message("switched_noise_type", noise_type=args["noise_type"])
+                args = _prompt_replacement_noise(args)
             elif choice == "v":
                 print_message("switched_to_plot")
                 args = switch_to_plot(args)
@@ -533,29 +587,7 @@ def validate_and_prompt(args: Dict) -> Dict:
             "density_noise_prompt", "p", ["p", "switch", "c"]
         )
         if choice == "switch":
-            print_message("suggested_multi_qubit_noise_types")
-            new_noise = input_handler.get_input(
-                "noise_type_prompt",
-                "depolarizing",
-                valid_options=[
-                    "d",
-                    "p",
-                    "t",
-                    "depolarizing",
-                    "phase_flip",
-                    "thermal_relaxation",
-                ],
-            )
-            args["noise_type"] = (
-                "DEPOLARIZING"
-                if new_noise in ["d", "depolarizing"]
-                else (
-                    "PHASE_FLIP"
-                    if new_noise in ["p", "phase_flip"]
-                    else "THERMAL_RELAXATION"
-                )
-            )
-            print_message("switched_noise_type", noise_type=args["noise_type"])
+            args = _prompt_replacement_noise(args)
         elif choice == "p":
             args["noise_enabled"] = False
             print_message("noise_disabled")
@@ -616,9 +648,87 @@ def collect_parameters(interactive: bool = True) -> Dict:
     return validate_parameters(args)
 
 
+def _run_experiment_cached(
+    args_for_experiment: Dict,
+) -> Tuple["QuantumCircuit", Union[Dict, "DensityMatrix"]]:
+    """
+    Runs the experiment, reusing the stored result for identical deterministic runs.
+    """
+    if not experiment_cache.is_cacheable(args_for_experiment):
+        return run_experiment(**args_for_experiment)
+    key = experiment_cache.cache_key(args_for_experiment)
+    cached = experiment_cache.load(key)
+    if cached is not None:
+        logger_instance.debug(f"Reusing cached experiment result {key}")
+        return cached
+    qc, result = run_experiment(**args_for_experiment)
+    experiment_cache.store(key, (qc, result))
+    return qc, result
+
+
+def _results_filename(args: Dict, suffix: str = "") -> str:
+    """
+    Builds the timestamped results filename for an experiment.
+    """
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+    return (
+        f"{timestamp}_experiment_results_{args['num_qubits']}q_{args['state_type']}_"
+        f"{args['noise_type']}_{args['sim_mode']}{suffix}.json"
+    )
+
+
+def run_batch(pending_runs: List[Dict]) -> None:
+    """
+    Runs queued experiments in one batch and saves each result.
+
+    Queued runs skip visualization; their results are saved like single runs,
+    with the queue position (and, for qasm runs, the shot count) in the filename.
+    """
+    print_message("batch_running", count=len(pending_runs))
+    runs = []
+    for args in pending_runs:
+        args_for_experiment = {
+            key: value
+            for key, value in args.items()
+            if key not in _NON_EXPERIMENT_KEYS
+        }
+        args_for_experiment["experiment_id"] = _new_id()
+        runs.append(args_for_experiment)
+
+    outputs = run_experiment_batch(runs)
+    for idx, (args, args_for_experiment, (qc, result)) in enumerate(
+        zip(pending_runs, runs, outputs), start=1
+    ):
+        shots_part = f"_{args['shots']}shots" if args["sim_mode"] == "qasm" else ""
+        filename = _results_filename(args, suffix=f"{shots_part}_batch{idx}")
+        ExperimentUtils.save_results(
+            result,
+            circuit=qc,
+            experiment_params=args_for_experiment,
+            filename=filename,
+            experiment_id=args_for_experiment["experiment_id"],
+        )
+        print_message("experiment_completed", filename=filename)
+
+
+def _offer_pending_runs(pending_runs: List[Dict]) -> None:
+    """
+    Asks whether to run queued experiments before they are dropped, and runs them if so.
+    """
+    if not pending_runs:
+        return
+    choice = input_handler.get_input(
+        "batch_pending_prompt", "y", ["y", "n"], count=len(pending_runs)
+    )
+    if choice == "y":
+        run_batch(pending_runs)
+    else:
+        print_message("batch_discarded", count=len(pending_runs))
+
+
 def run_and_visualize(
     args: Dict, experiment_id: str
-) -> Tuple[QuantumCircuit, Union[Dict, DensityMatrix], bool]:
+) -> Tuple["QuantumCircuit", Union[Dict, "DensityMatrix"], bool]:
     """
     Runs the experiment and handles visualization.
     """
@@ -626,27 +736,7 @@ def run_and_visualize(
     args_for_experiment = {
         key: value
         for key, value in args.items()
-        if key
-        not in [
-            "visualization_type",
-            "save_plot",
-            "min_occurrences",
-            "show_real",
-            "show_imag",
-            "hypergraph_config",
-            "noise_stepped",
-            "noise_start",
-            "noise_end",
-            "noise_steps",
-            "z_prob_start",
-            "z_prob_end",
-            "i_prob_start",
-            "i_prob_end",
-            "t1_start",
-            "t1_end",
-            "t2_start",
-            "t2_end",
-        ]
+        if key not in _NON_EXPERIMENT_KEYS
     }
     args_for_experiment["experiment_id"] = experiment_id
 
@@ -692,6 +782,8 @@ def run_and_visualize(
             )
         )
 
+        from tqdm import tqdm  # Only needed for stepped runs
+
         results = []
         for idx in tqdm(range(args["noise_steps"]), desc="Running stepped simulations"):
             print_message(
@@ -723,7 +815,7 @@ def run_and_visualize(
         time_steps = error_rates.tolist()  # Use error rates as "time steps"
     else:
         # Single run
-        qc, result = run_experiment(**args_for_experiment)
+        qc, result = _run_experiment_cached(args_for_experiment)
         results = result
         time_steps = None
 
@@ -736,11 +828,7 @@ def run_and_visualize(
         logger_instance.debug(f"Single result type: {type(results)}")
 
     # Save results (timestamp first)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = (
-        f"{timestamp}_experiment_results_{args['num_qubits']}q_{args['state_type']}_"
-        f"{args['noise_type']}_{args['sim_mode']}.json"
-    )
+    filename = _results_filename(args)
 
     ExperimentUtils.save_results(
         results[-1] if args.get("noise_stepped", False) else results,
@@ -808,7 +896,7 @@ def run_and_visualize(
 @click.option("--shots", type=int, help="Number of shots for qasm simulation")
 @click.option(
     "--sim-mode",
-    type=click.Choice(["qasm", "density"], case_sensitive=False),
+    type=click.Choice(VALID_SIM_MODES, case_sensitive=False),
     help="Simulation mode",
 )
 @click.option("--error-rate", type=float, help="Custom error rate for noise models")
@@ -823,6 +911,9 @@ def run_and_visualize(
 @click.option(
     "--interactive/--no-interactive", default=True, help="Run in interactive mode"
 )
+@click.option(
+    "--clear-cache", is_flag=True, help="Delete cached experiment results before running"
+)
 def main(
     num_qubits: Optional[int],
     state_type: Optional[str],
@@ -836,6 +927,7 @@ def main(
     t1: Optional[float],
     t2: Optional[float],
     interactive: bool,
+    clear_cache: bool,
 ):
     """
     Quantum Experiment Interactive Runner
@@ -843,6 +935,8 @@ def main(
     A CLI tool to run quantum experiments with configurable parameters,
     supporting interactive and non-interactive modes.
     """
+    if clear_cache:
+        print_message("cache_cleared", count=experiment_cache.clear())
     if interactive:
         interactive_experiment()
     else:
@@ -867,7 +961,7 @@ def main(
             "custom_params": None,
         }
         args = apply_defaults(args)
-        experiment_id = str(uuid.uuid4())
+        experiment_id = _new_id()
         qc, result, _ = run_and_visualize(args, experiment_id)
 
 
@@ -890,18 +984,14 @@ def interactive_experiment():
                 "viz_type_prompt", "p", ["p", "h", "n"]
             )
             args = collect_parameters(interactive=True)
-            args["visualization_type"] = (
-                "plot"
-                if viz_choice in ["p", "plot"]
-                else "hypergraph" if viz_choice in ["h", "hypergraph"] else "none"
-            )
+            args["visualization_type"] = _VIZ_CHOICE_MAP.get(viz_choice, "none")
             if args["visualization_type"] != "none":
                 args["save_plot"] = (
-                    input_handler.get_input("save_plot_prompt", "").strip() or None
+                    input_handler.get_input_free("save_plot_prompt", "").strip() or None
                 )
                 if args["visualization_type"] == "plot" and args["sim_mode"] == "qasm":
                     args["min_occurrences"] = input_handler.get_numeric_input(
-                        "min_occurrences_prompt", "0"
+                        "min_occurrences_prompt", "0", retry=True
                     )
         elif choice == "n":
             args = collect_parameters(interactive=True)
@@ -918,12 +1008,14 @@ def interactive_experiment():
         # Confirm before running
         if input_handler.get_input("proceed_prompt", "y", ["y", "n"]) != "y":
             print_message("params_discarded")
+            _forget_validated_args()
             continue
 
-        experiment_id = str(uuid.uuid4())
+        experiment_id = _new_id()
         qc, result, plot_closed_with_ctrl_c = run_and_visualize(args, experiment_id)
 
         # Rerun prompt
+        pending_runs: List[Dict] = []
         while True:
             print_message("current_params", params=format_params(args))
             if plot_closed_with_ctrl_c:
@@ -932,7 +1024,7 @@ def interactive_experiment():
                     "rerun_choice_prompt", "y", ["y", "n"]
                 )
                 if rerun_choice == "y":
-                    experiment_id = str(uuid.uuid4())
+                    experiment_id = _new_id()
                     qc, result, plot_closed_with_ctrl_c = run_and_visualize(
                         args, experiment_id
                     )
@@ -940,31 +1032,64 @@ def interactive_experiment():
                 else:
                     plot_closed_with_ctrl_c = False  # Reset flag
 
-            next_choice = input_handler.get_input("rerun_prompt", "r", ["r", "n", "q"])
+            next_choice = input_handler.get_input(
+                "rerun_prompt", "r", ["r", "n", "b", "x", "q"]
+            )
             if next_choice == "r":
                 print_message("rerun_same")
+                num_qubits = args["num_qubits"]
+                state_type = args["state_type"]
+                noise_type = args["noise_type"]
+                noise_enabled = args["noise_enabled"]
                 logger.log_with_experiment_id(
                     logger_instance,
                     "info",
-                    f"Rerunning experiment with {args['num_qubits']} qubits, {args['state_type']} state, "
-                    f"{'with' if args['noise_enabled'] else 'without'} {args['noise_type']} noise",
+                    f"Rerunning experiment with {num_qubits} qubits, {state_type} state, "
+                    f"{'with' if noise_enabled else 'without'} {noise_type} noise",
                     experiment_id,
                     extra_info={
-                        "num_qubits": args["num_qubits"],
-                        "state_type": args["state_type"],
-                        "noise_type": args["noise_type"],
-                        "noise_enabled": args["noise_enabled"],
+                        "num_qubits": num_qubits,
+                        "state_type": state_type,
+                        "noise_type": noise_type,
+                        "noise_enabled": noise_enabled,
                         "sim_mode": args["sim_mode"],
                     },
                 )
-                experiment_id = str(uuid.uuid4())
+                experiment_id = _new_id()
                 qc, result, plot_closed_with_ctrl_c = run_and_visualize(
                     args, experiment_id
                 )
+            elif next_choice == "b":
+                if args.get("noise_stepped", False):
+                    print_message("batch_stepped_unsupported")
+                    continue
+                if args["sim_mode"] == "density":
+                    # Density runs are not sampled by shots; queue them as they are
+                    pending_runs.append(dict(args))
+                    print_message("batch_queued_density", count=len(pending_runs))
+                    continue
+                shots = input_handler.get_numeric_input(
+                    "batch_shots_prompt", str(args["shots"]), retry=True
+                )
+                while shots < 1:
+                    print_message("batch_shots_invalid", shots=shots)
+                    shots = input_handler.get_numeric_input(
+                        "batch_shots_prompt", str(args["shots"]), retry=True
+                    )
+                pending_runs.append({**args, "shots": shots})
+                print_message("batch_queued", shots=shots, count=len(pending_runs))
+            elif next_choice == "x":
+                if not pending_runs:
+                    print_message("batch_empty")
+                    continue
+                run_batch(pending_runs)
+                pending_runs = []
             elif next_choice == "n":
+                _offer_pending_runs(pending_runs)
                 print_message("restart_params")
                 break
             else:  # 'q'
+                _offer_pending_runs(pending_runs)
                 print_message("goodbye")
                 return
 
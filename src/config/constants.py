@@ -15,6 +15,9 @@ VALID_NOISE_TYPES = [
 ]
 VALID_STATE_TYPES = ["GHZ", "W", "CLUSTER"]
 
+# Simulation modes, in display order
+VALID_SIM_MODES = ("qasm", "density")
+
 # One-letter shortcuts for noise types (case-insensitive)
 NOISE_SHORTCUTS = {
     "d": "DEPOLARIZING",
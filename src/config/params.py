@@ -1,5 +1,6 @@
 # src/config/params.py
 
+import sys
 from typing import Dict, Optional
 from rich.console import Console
 from .defaults import (
@@ -13,12 +14,15 @@ from .defaults import (
 from .constants import (
     VALID_NOISE_TYPES,
     VALID_STATE_TYPES,
+    VALID_SIM_MODES,
     NOISE_SHORTCUTS,
     SINGLE_QUBIT_NOISE_TYPES,
 )
 
 console = Console()
 
+_SIM_MODES = frozenset(VALID_SIM_MODES)
+
 
 def validate_parameters(args: Dict) -> Dict:
     """
@@ -62,7 +66,7 @@ def validate_parameters(args: Dict) -> Dict:
         raise ValueError("shots must be an integer >= 1")
 
     # Validate sim_mode
-    if validated_args["sim_mode"] not in ["qasm", "density"]:
+    if validated_args["sim_mode"] not in _SIM_MODES:
         console.print(
             "[bold red]Error: sim_mode must be either 'qasm' or 'density'[/bold red]"
         )
@@ -70,7 +74,10 @@ def validate_parameters(args: Dict) -> Dict:
 
     # Noise type validation
     noise_input = validated_args["noise_type"].lower()
-    validated_args["noise_type"] = NOISE_SHORTCUTS.get(noise_input, noise_input.upper())
+    # Interned so comparisons against the noise type constants hit the identity fast path
+    validated_args["noise_type"] = NOISE_SHORTCUTS.get(
+        noise_input, sys.intern(noise_input.upper())
+    )
     if validated_args["noise_type"] not in VALID_NOISE_TYPES:
         console.print(
             f"[bold red]Error: Invalid noise type '{validated_args['noise_type']}'. Choose from {VALID_NOISE_TYPES}.[/bold red]"
@@ -78,7 +85,7 @@ def validate_parameters(args: Dict) -> Dict:
         raise ValueError(f"Invalid noise type: {validated_args['noise_type']}")
 
     # State type validation
-    validated_args["state_type"] = validated_args["state_type"].upper()
+    validated_args["state_type"] = sys.intern(validated_args["state_type"].upper())
     if validated_args["state_type"] not in VALID_STATE_TYPES:
         console.print(
             f"[bold red]Error: Invalid state type '{validated_args['state_type']}'. Choose from {VALID_STATE_TYPES}.[/bold red]"
@@ -1,7 +1,17 @@
 # src/noise_models/amplitude_damping.py
 
-from qiskit_aer.noise import amplitude_damping_error, NoiseModel
-from .base_noise import BaseNoise
+from functools import lru_cache
+from qiskit_aer.noise import amplitude_damping_error, NoiseModel, QuantumError
+from .base_noise import BaseNoise, SINGLE_QUBIT_GATES
+
+
+@lru_cache(maxsize=32)
+def _amplitude_damping_error(error_rate: float) -> QuantumError:
+    """
+    Builds the amplitude damping error once per rate; NoiseModel never mutates it.
+    """
+    return amplitude_damping_error(error_rate)
+
 
 class AmplitudeDampingNoise(BaseNoise):
     """
@@ -10,20 +20,23 @@ class AmplitudeDampingNoise(BaseNoise):
     """
     def apply(self, noise_model: NoiseModel, gate_list: list, qubits_for_error: int = None) -> None:
         # Only apply amplitude damping to single-qubit gates
-        valid_gates = [g for g in gate_list if g in ["id", "u1", "u2", "u3"]]
+        valid_gates = self._filter_gates(gate_list, SINGLE_QUBIT_GATES)
         if not valid_gates:
-            self.log_noise_application(
-                noise_type="AMPLITUDE_DAMPING",
-                gates=gate_list,
-                extra_info={"warning": "No valid 1-qubit gates found, skipping"}
-            )
+            if self.log_enabled:
+                self.log_noise_application(
+                    noise_type="AMPLITUDE_DAMPING",
+                    gates=gate_list,
+                    extra_info={"warning": "No valid 1-qubit gates found, skipping"}
+                )
             return
 
         # Amplitude damping is always 1-qubit, so ignore qubits_for_error
-        noise = amplitude_damping_error(self.error_rate)
+        # Rounded so rates recomputed with float noise share one cache entry
+        noise = _amplitude_damping_error(round(self.error_rate, 12))
         noise_model.add_all_qubit_quantum_error(noise, valid_gates)
-        self.log_noise_application(
-            noise_type="AMPLITUDE_DAMPING",
-            gates=valid_gates,
-            extra_info={"error_rate": self.error_rate}
-        )
+        if self.log_enabled:
+            self.log_noise_application(
+                noise_type="AMPLITUDE_DAMPING",
+                gates=valid_gates,
+                extra_info={"error_rate": self.error_rate}
+            )
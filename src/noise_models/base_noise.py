@@ -3,13 +3,16 @@
 from qiskit_aer.noise import NoiseModel
 import logging
 from src.utils import logger as logger_utils
-from typing import Optional
+from typing import Iterable, List, Optional
 
 logger = logging.getLogger("QuantumExperiment.NoiseModels")
 
 # Default error rate for base noise (could also import from a config file)
 DEFAULT_ERROR_RATE = 0.1
 
+# Gates the single-qubit channels (amplitude/phase damping, bit flip) apply to
+SINGLE_QUBIT_GATES = frozenset(("id", "u1", "u2", "u3"))
+
 class BaseNoise:
     """
     Base class for all noise models, providing a template for noise application.
@@ -23,6 +26,8 @@ class BaseNoise:
         self.error_rate = error_rate
         self.num_qubits = num_qubits
         self.experiment_id = experiment_id
+        # Checked once; apply() skips building log payloads when debug records are dropped
+        self.log_enabled = logger.isEnabledFor(logging.DEBUG)
 
     def apply(self, noise_model: NoiseModel, gate_list: list, qubits_for_error: int = None) -> None:
         """
@@ -38,10 +43,27 @@ class BaseNoise:
         """
         raise NotImplementedError("Subclasses must implement apply()")
 
+    @staticmethod
+    def _filter_gates(gate_list: Iterable[str], allowed: frozenset) -> List[str]:
+        """
+        Returns the gates from gate_list that are in allowed, keeping gate_list's order.
+
+        Args:
+            gate_list (Iterable[str]): Gate names requested for the noise.
+            allowed (frozenset): Gate names the noise channel supports.
+
+        Returns:
+            List[str]: The supported gates, in their original order.
+        """
+        return [g for g in gate_list if g in allowed]
+
     def log_noise_application(self, noise_type: str, gates: list, extra_info: Optional[dict] = None) -> None:
         """
         Logs the application of noise to gates using structured logging.
 
+        Callers check self.log_enabled first, so the extra_info dict is only built
+        when the debug record will be emitted.
+
         Args:
             noise_type (str): Type of noise being applied (e.g., "DEPOLARIZING").
             gates (list): List of gates to which noise was applied.
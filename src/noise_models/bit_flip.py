@@ -1,27 +1,29 @@
 # src/noise_models/bit_flip.py
 
 from qiskit_aer.noise import pauli_error, NoiseModel
-from .base_noise import BaseNoise
+from .base_noise import BaseNoise, SINGLE_QUBIT_GATES
 
 class BitFlipNoise(BaseNoise):
     """
     Bit flip noise, modeling X-axis errors on qubits.
     """
     def apply(self, noise_model: NoiseModel, gate_list: list, qubits_for_error: int = None) -> None:
-        valid_gates = [g for g in gate_list if g in ["id", "u1", "u2", "u3"]]
+        valid_gates = self._filter_gates(gate_list, SINGLE_QUBIT_GATES)
         if not valid_gates:
-            self.log_noise_application(
-                noise_type="BIT_FLIP",
-                gates=gate_list,
-                extra_info={"warning": "No valid 1-qubit gates found, skipping"}
-            )
+            if self.log_enabled:
+                self.log_noise_application(
+                    noise_type="BIT_FLIP",
+                    gates=gate_list,
+                    extra_info={"warning": "No valid 1-qubit gates found, skipping"}
+                )
             return
 
         # Bit flip noise is always 1-qubit, so ignore qubits_for_error
         noise = pauli_error([("X", self.error_rate), ("I", 1 - self.error_rate)])
         noise_model.add_all_qubit_quantum_error(noise, valid_gates)
-        self.log_noise_application(
-            noise_type="BIT_FLIP",
-            gates=valid_gates,
-            extra_info={"error_rate": self.error_rate}
-        )
+        if self.log_enabled:
+            self.log_noise_application(
+                noise_type="BIT_FLIP",
+                gates=valid_gates,
+                extra_info={"error_rate": self.error_rate}
+            )
@@ -13,10 +13,11 @@ class DepolarizingNoise(BaseNoise):
 
         # Create a depolarizing error for the appropriate number of qubits
         error = depolarizing_error(self.error_rate, num_qubits_for_error)
-        for gate in gates:
-            noise_model.add_all_qubit_quantum_error(error, gate)
-        self.log_noise_application(
-            noise_type="DEPOLARIZING",
-            gates=gates,
-            extra_info={"error_rate": self.error_rate}
-        )
+        # One call for the whole gate list; Qiskit adds gates in order as the loop did
+        noise_model.add_all_qubit_quantum_error(error, gates)
+        if self.log_enabled:
+            self.log_noise_application(
+                noise_type="DEPOLARIZING",
+                gates=gates,
+                extra_info={"error_rate": self.error_rate}
+            )
@@ -78,16 +78,15 @@ class PhaseFlipNoise(BaseNoise):
         error = pauli_error([("Z", self.z_prob), ("I", self.i_prob)])
         if specific_qubits is not None:
             for qubit in specific_qubits:
-                for gate in gates:
-                    noise_model.add_quantum_error(error, gate, [qubit])
+                noise_model.add_quantum_error(error, gates, [qubit])
         else:
             # Apply to all qubits if specific_qubits is not provided
-            for gate in gates:
-                noise_model.add_all_qubit_quantum_error(error, gate)
+            noise_model.add_all_qubit_quantum_error(error, gates)
 
         # Log the noise application using the inherited method
-        self.log_noise_application(
-            noise_type="PHASE_FLIP",
-            gates=gates,
-            extra_info={"z_prob": self.z_prob, "i_prob": self.i_prob},
-        )
+        if self.log_enabled:
+            self.log_noise_application(
+                noise_type="PHASE_FLIP",
+                gates=gates,
+                extra_info={"z_prob": self.z_prob, "i_prob": self.i_prob},
+            )
@@ -15,10 +15,10 @@ class ThermalRelaxationNoise(BaseNoise):
     def apply(self, noise_model: NoiseModel, gates: list, qubits_for_error: int = None) -> None:
         # Thermal relaxation noise is always 1-qubit, so ignore qubits_for_error
         error = thermal_relaxation_error(self.t1, self.t2, self.error_rate)
-        for gate in gates:
-            noise_model.add_all_qubit_quantum_error(error, gate)
-        self.log_noise_application(
-            noise_type="THERMAL_RELAXATION",
-            gates=gates,
-            extra_info={"t1": self.t1, "t2": self.t2}
-        )
+        noise_model.add_all_qubit_quantum_error(error, gates)
+        if self.log_enabled:
+            self.log_noise_application(
+                noise_type="THERMAL_RELAXATION",
+                gates=gates,
+                extra_info={"t1": self.t1, "t2": self.t2}
+            )
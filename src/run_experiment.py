@@ -12,7 +12,10 @@ analysis (e.g., structured decoherence patterns in GHZ/W states).
 from qiskit import QuantumCircuit, transpile
 from qiskit_aer import Aer, AerSimulator
 from qiskit.quantum_info import DensityMatrix, Statevector
-from typing import Optional, Dict, Union, Tuple
+from collections import Counter
+from typing import Optional, Dict, List, Union, Tuple
+import inspect
+import json
 import logging
 import time
 import numpy as np  # Added for trace calculation
@@ -24,47 +27,15 @@ from src.utils import logger as logger_utils
 # Configure logger
 logger = logging.getLogger("QuantumExperiment.RunExperiment")
 
-def run_experiment(
+def _prepare_circuit(
+    state_type: str,
     num_qubits: int,
-    state_type: str = "GHZ",
-    noise_type: str = "DEPOLARIZING",
-    noise_enabled: bool = True,
-    shots: int = 1024,
-    sim_mode: str = "qasm",
-    error_rate: Optional[float] = None,
-    z_prob: Optional[float] = None,
-    i_prob: Optional[float] = None,
-    t1: Optional[float] = None,
-    t2: Optional[float] = None,
-    custom_params: Optional[Dict] = None,
-    experiment_id: str = "N/A"
-) -> Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]:
+    custom_params: Optional[Dict],
+    experiment_id: str,
+) -> QuantumCircuit:
     """
-    Runs a quantum experiment with specified parameters, supporting extensible noise models and research analysis.
-
-    Args:
-        num_qubits (int): Number of qubits in the circuit.
-        state_type (str): Type of quantum state ("GHZ", "W", "CLUSTER").
-        noise_type (str): Type of noise model to apply.
-        noise_enabled (bool): Whether to apply noise.
-        shots (int): Number of shots for qasm simulation.
-        sim_mode (str): Simulation mode ("qasm" or "density").
-        error_rate (float, optional): Custom error rate for noise models.
-        z_prob (float, optional): Z probability for PHASE_FLIP noise.
-        i_prob (float, optional): I probability for PHASE_FLIP noise.
-        t1 (float, optional): T1 relaxation time for THERMAL_RELAXATION noise.
-        t2 (float, optional): T2 dephasing time for THERMAL_RELAXATION noise.
-        custom_params (dict, optional): Custom parameters for state preparation or noise.
-        experiment_id (str): Unique identifier for this experiment run.
-
-    Returns:
-        Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]: The quantum circuit and simulation result (counts for qasm, density matrix for density mode).
-
-    Raises:
-        ValueError: If invalid parameters are provided.
-        Exception: If simulation fails.
+    Prepares the state circuit and logs its structure.
     """
-    # Prepare the quantum circuit
     qc = prepare_state(state_type, num_qubits, custom_params=custom_params, add_barrier=False, experiment_id=experiment_id)
     logger_utils.log_with_experiment_id(
         logger, "info",
@@ -86,45 +57,66 @@ def run_experiment(
             experiment_id,
             extra_info={"custom_params": custom_params}
         )
+    return qc
 
-    # Apply noise if enabled
-    noise_model = None
-    if noise_enabled:
-        try:
-            noise_model = create_noise_model(
-                noise_type=noise_type,
-                num_qubits=num_qubits,
-                error_rate=error_rate,
-                z_prob=z_prob,
-                i_prob=i_prob,
-                t1=t1,
-                t2=t2,
-                simulate_density=(sim_mode == "density"),
-                experiment_id=experiment_id
-            )
-            logger_utils.log_with_experiment_id(
-                logger, "info",
-                (f"Applied {noise_type} noise with params: error_rate={error_rate}, "
-                 f"z_prob={z_prob}, i_prob={i_prob}, t1={t1}, t2={t2}"),
-                experiment_id,
-                extra_info={
-                    "noise_type": noise_type,
-                    "error_rate": error_rate,
-                    "z_prob": z_prob,
-                    "i_prob": i_prob,
-                    "t1": t1,
-                    "t2": t2
-                }
-            )
-        except Exception as e:
-            logger_utils.log_with_experiment_id(
-                logger, "error",
-                f"Failed to apply noise model: {str(e)}",
-                experiment_id
-            )
-            raise
 
-    # Select the appropriate backend and configure the circuit
+def _build_noise_model(
+    noise_type: str,
+    noise_enabled: bool,
+    num_qubits: int,
+    sim_mode: str,
+    error_rate: Optional[float],
+    z_prob: Optional[float],
+    i_prob: Optional[float],
+    t1: Optional[float],
+    t2: Optional[float],
+    experiment_id: str,
+):
+    """
+    Builds the noise model for a run, or returns None when noise is disabled.
+    """
+    if not noise_enabled:
+        return None
+    try:
+        noise_model = create_noise_model(
+            noise_type=noise_type,
+            num_qubits=num_qubits,
+            error_rate=error_rate,
+            z_prob=z_prob,
+            i_prob=i_prob,
+            t1=t1,
+            t2=t2,
+            simulate_density=(sim_mode == "density"),
+            experiment_id=experiment_id
+        )
+        logger_utils.log_with_experiment_id(
+            logger, "info",
+            (f"Applied {noise_type} noise with params: error_rate={error_rate}, "
+             f"z_prob={z_prob}, i_prob={i_prob}, t1={t1}, t2={t2}"),
+            experiment_id,
+            extra_info={
+                "noise_type": noise_type,
+                "error_rate": error_rate,
+                "z_prob": z_prob,
+                "i_prob": i_prob,
+                "t1": t1,
+                "t2": t2
+            }
+        )
+    except Exception as e:
+        logger_utils.log_with_experiment_id(
+            logger, "error",
+            f"Failed to apply noise model: {str(e)}",
+            experiment_id
+        )
+        raise
+    return noise_model
+
+
+def _configure_backend(qc: QuantumCircuit, sim_mode: str, experiment_id: str):
+    """
+    Selects the simulator for the mode and adds the matching save/measure instructions.
+    """
     if sim_mode == "density":
         # TODO: Revert to method="density_matrix" once Qiskit-Aer bug with save_density_matrix is fixed
         backend = AerSimulator(method="statevector")
@@ -142,8 +134,13 @@ def run_experiment(
             "Added measurements for qasm simulation",
             experiment_id
         )
+    return backend
+
 
-    # Transpile and run the circuit
+def _transpile(qc: QuantumCircuit, backend, experiment_id: str) -> QuantumCircuit:
+    """
+    Transpiles the circuit for the backend, logging timing and compiled size.
+    """
     logger_utils.log_with_experiment_id(
         logger, "info",
         "Transpiling circuit",
@@ -165,14 +162,20 @@ def run_experiment(
     print(f"Compiled circuit: {circuit_compiled}")
     # print(f"Backend supports density_matrix: {backend.configuration().simulator}")
     # print(f"Supported instructions: {backend.operation_names}")
+    return circuit_compiled
 
-    # Run simulation
+
+def _simulate(backend, circuits, shots: int, noise_model, experiment_id: str, **run_options):
+    """
+    Runs one or more compiled circuits on the backend and returns the Aer result.
+    """
     start_time = time.time()
     try:
         job = backend.run(
-            circuit_compiled,
-            shots=shots if sim_mode == "qasm" else 1,
+            circuits,
+            shots=shots,
             noise_model=noise_model,
+            **run_options,
         )
         result = job.result()
     except Exception as e:
@@ -189,43 +192,205 @@ def run_experiment(
         experiment_id,
         extra_info={"simulation_time": simulation_time}
     )
+    return result
+
+
+def _qasm_result(counts: Dict[str, int], experiment_id: str) -> Dict:
+    """
+    Logs qasm counts and wraps them in the result dictionary.
+    """
+    total_counts = sum(counts.values())
+    probabilities = {state: count / total_counts for state, count in counts.items()}
+    logger_utils.log_with_experiment_id(
+        logger, "info",
+        "Qasm simulation completed",
+        experiment_id,
+        extra_info={
+            "counts": counts,
+            "probabilities": probabilities,
+            "total_shots": total_counts
+        }
+    )
+    return {"counts": counts, "metadata_file": "results_placeholder"}
+
+
+def _density_result(statevector, experiment_id: str) -> DensityMatrix:
+    """
+    Converts the saved statevector to a density matrix and logs its trace.
+    """
+    density_matrix = DensityMatrix(statevector)
+    logger_utils.log_with_experiment_id(
+        logger, "info",
+        "Density simulation completed via statevector workaround",
+        experiment_id,
+        extra_info={
+            "density_matrix_shape": density_matrix.data.shape,
+            "trace": float(np.real(np.trace(density_matrix.data)))
+        }
+    )
+    return density_matrix
+
+
+def run_experiment(
+    num_qubits: int,
+    state_type: str = "GHZ",
+    noise_type: str = "DEPOLARIZING",
+    noise_enabled: bool = True,
+    shots: int = 1024,
+    sim_mode: str = "qasm",
+    error_rate: Optional[float] = None,
+    z_prob: Optional[float] = None,
+    i_prob: Optional[float] = None,
+    t1: Optional[float] = None,
+    t2: Optional[float] = None,
+    custom_params: Optional[Dict] = None,
+    experiment_id: str = "N/A"
+) -> Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]:
+    """
+    Runs a quantum experiment with specified parameters, supporting extensible noise models and research analysis.
+
+    Args:
+        num_qubits (int): Number of qubits in the circuit.
+        state_type (str): Type of quantum state ("GHZ", "W", "CLUSTER").
+        noise_type (str): Type of noise model to apply.
+        noise_enabled (bool): Whether to apply noise.
+        shots (int): Number of shots for qasm simulation.
+        sim_mode (str): Simulation mode ("qasm" or "density").
+        error_rate (float, optional): Custom error rate for noise models.
+        z_prob (float, optional): Z probability for PHASE_FLIP noise.
+        i_prob (float, optional): I probability for PHASE_FLIP noise.
+        t1 (float, optional): T1 relaxation time for THERMAL_RELAXATION noise.
+        t2 (float, optional): T2 dephasing time for THERMAL_RELAXATION noise.
+        custom_params (dict, optional): Custom parameters for state preparation or noise.
+        experiment_id (str): Unique identifier for this experiment run.
+
+    Returns:
+        Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]: The quantum circuit and simulation result (counts for qasm, density matrix for density mode).
+
+    Raises:
+        ValueError: If invalid parameters are provided.
+        Exception: If simulation fails.
+    """
+    qc = _prepare_circuit(state_type, num_qubits, custom_params, experiment_id)
+    noise_model = _build_noise_model(
+        noise_type, noise_enabled, num_qubits, sim_mode,
+        error_rate, z_prob, i_prob, t1, t2, experiment_id
+    )
+    backend = _configure_backend(qc, sim_mode, experiment_id)
+    circuit_compiled = _transpile(qc, backend, experiment_id)
+    result = _simulate(
+        backend, circuit_compiled, shots if sim_mode == "qasm" else 1, noise_model, experiment_id
+    )
 
-    # Process results
     if sim_mode == "qasm":
-        counts = result.get_counts()
-        total_counts = sum(counts.values())
-        probabilities = {state: count / total_counts for state, count in counts.items()}
-        logger_utils.log_with_experiment_id(
-            logger, "info",
-            "Qasm simulation completed",
-            experiment_id,
-            extra_info={
-                "counts": counts,
-                "probabilities": probabilities,
-                "total_shots": total_counts
-            }
-        )
-        result_data = {"counts": counts, "metadata_file": "results_placeholder"}
+        result_data = _qasm_result(result.get_counts(), experiment_id)
     else:
-        statevector = result.get_statevector()
-        density_matrix = DensityMatrix(statevector)
-        logger_utils.log_with_experiment_id(
-            logger, "info",
-            "Density simulation completed via statevector workaround",
-            experiment_id,
-            extra_info={
-                "density_matrix_shape": density_matrix.data.shape,
-                "trace": float(np.real(np.trace(density_matrix.data)))
-            }
-        )
-        result_data = density_matrix
+        result_data = _density_result(result.get_statevector(), experiment_id)
 
     return qc, result_data
 
 
+# Keyword defaults of run_experiment, used to fill in partial batch entries
+_RUN_DEFAULTS = {
+    name: param.default
+    for name, param in inspect.signature(run_experiment).parameters.items()
+    if param.default is not inspect.Parameter.empty
+}
+
+
+def _batch_group_key(params: Dict) -> str:
+    """
+    Identifies the runs that can share simulator work: same parameters apart from
+    shots and experiment_id.
+    """
+    shared = {k: v for k, v in params.items() if k not in ("shots", "experiment_id")}
+    return json.dumps(shared, sort_keys=True, default=str)
+
+
+def run_experiment_batch(
+    runs: List[Dict],
+) -> List[Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]]:
+    """
+    Runs several experiments, sharing simulator work between runs that differ only in shots.
+
+    Runs are grouped by all parameters except `shots` and `experiment_id`. Each group
+    prepares, transpiles, and builds its noise model once. Qasm groups submit the circuit
+    once for the sum of the runs' shots and give each run its own slice of the per-shot
+    memory, so every run keeps its requested shot count and independent samples at the
+    cost of separate runs. Noisy density groups submit one circuit per run in a single
+    call, since each run samples its own noise trajectory; noiseless density runs are
+    deterministic and share one simulation.
+
+    Args:
+        runs (List[Dict]): Keyword arguments for run_experiment, one dict per run.
+
+    Returns:
+        List[Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]]: Circuit and result for
+            each run, in the order given.
+
+    Raises:
+        ValueError: If a run's shots is not an integer >= 1, or other parameters
+            are invalid.
+        Exception: If simulation fails.
+    """
+    groups: Dict[str, List[int]] = {}
+    for idx, run in enumerate(runs):
+        shots = run.get("shots", _RUN_DEFAULTS["shots"])
+        if not isinstance(shots, int) or shots < 1:
+            raise ValueError(f"shots must be an integer >= 1, got {shots!r} for run {idx}")
+        groups.setdefault(_batch_group_key({**_RUN_DEFAULTS, **run}), []).append(idx)
+
+    outputs: List[Optional[Tuple[QuantumCircuit, Union[Dict, DensityMatrix]]]] = [None] * len(runs)
+    for indices in groups.values():
+        params = {**_RUN_DEFAULTS, **runs[indices[0]]}
+        experiment_id = params["experiment_id"]
+        sim_mode = params["sim_mode"]
+
+        qc = _prepare_circuit(
+            params["state_type"], params["num_qubits"], params["custom_params"], experiment_id
+        )
+        noise_model = _build_noise_model(
+            params["noise_type"], params["noise_enabled"], params["num_qubits"], sim_mode,
+            params["error_rate"], params["z_prob"], params["i_prob"],
+            params["t1"], params["t2"], experiment_id
+        )
+        backend = _configure_backend(qc, sim_mode, experiment_id)
+        circuit_compiled = _transpile(qc, backend, experiment_id)
+
+        if sim_mode == "qasm":
+            shots = [runs[idx].get("shots", _RUN_DEFAULTS["shots"]) for idx in indices]
+            result = _simulate(
+                backend, circuit_compiled, sum(shots), noise_model, experiment_id, memory=True
+            )
+            memory = result.get_memory()
+            start = 0
+            for idx, run_shots in zip(indices, shots):
+                counts = dict(Counter(memory[start:start + run_shots]))
+                start += run_shots
+                run_id = runs[idx].get("experiment_id", _RUN_DEFAULTS["experiment_id"])
+                outputs[idx] = (qc, _qasm_result(counts, run_id))
+        elif noise_model is not None:
+            # Each noisy run samples its own trajectory, so each gets its own circuit
+            result = _simulate(
+                backend, [circuit_compiled] * len(indices), 1, noise_model, experiment_id
+            )
+            for pos, idx in enumerate(indices):
+                run_id = runs[idx].get("experiment_id", _RUN_DEFAULTS["experiment_id"])
+                outputs[idx] = (qc, _density_result(result.get_statevector(pos), run_id))
+        else:
+            # Noiseless density results are deterministic, so one simulation serves the group
+            result = _simulate(backend, circuit_compiled, 1, noise_model, experiment_id)
+            statevector = result.get_statevector()
+            for idx in indices:
+                run_id = runs[idx].get("experiment_id", _RUN_DEFAULTS["experiment_id"])
+                outputs[idx] = (qc, _density_result(statevector, run_id))
+
+    return outputs
+
+
 if __name__ == "__main__":
     # For testing: run an experiment in density mode
     import uuid
-    experiment_id = str(uuid.uuid4())
+    experiment_id = uuid.uuid4().hex
     qc, result = run_experiment(num_qubits=3, state_type="GHZ", sim_mode="density", experiment_id=experiment_id)
     print(result)
@@ -0,0 +1,111 @@
+# src/tests/test_experiment_cache.py
+
+import os
+import pytest
+from src.utils import experiment_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """
+    Fixture to point the experiment cache at a temporary directory.
+    """
+    monkeypatch.setattr(experiment_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(experiment_cache, "_memory_cache", {})
+
+
+def test_is_cacheable_only_noiseless_density():
+    """
+    Test that only deterministic (noiseless density) runs are cacheable.
+    """
+    assert experiment_cache.is_cacheable({"sim_mode": "density", "noise_enabled": False})
+    assert not experiment_cache.is_cacheable({"sim_mode": "density", "noise_enabled": True})
+    assert not experiment_cache.is_cacheable({"sim_mode": "qasm", "noise_enabled": False})
+
+
+def test_cache_key_ignores_experiment_id_and_order():
+    """
+    Test that the cache key depends only on parameter values.
+    """
+    a = {"num_qubits": 3, "state_type": "GHZ", "experiment_id": "a"}
+    b = {"state_type": "GHZ", "num_qubits": 3, "experiment_id": "b"}
+    assert experiment_cache.cache_key(a) == experiment_cache.cache_key(b)
+    assert experiment_cache.cache_key(a) != experiment_cache.cache_key(
+        {**a, "num_qubits": 4}
+    )
+
+
+def test_store_and_load_persist_to_disk(monkeypatch):
+    """
+    Test that stored values survive a cleared in-memory cache.
+    """
+    experiment_cache.store("abc", {"counts": {"000": 1}})
+    monkeypatch.setattr(experiment_cache, "_memory_cache", {})
+    assert experiment_cache.load("abc") == {"counts": {"000": 1}}
+    assert experiment_cache.load("missing") is None
+
+
+def test_cache_key_includes_version_salt(monkeypatch):
+    """
+    Test that changing the schema/library salt changes every key.
+    """
+    params = {"num_qubits": 3, "state_type": "GHZ"}
+    before = experiment_cache.cache_key(params)
+    monkeypatch.setattr(experiment_cache, "_KEY_SALT", "other-version")
+    assert experiment_cache.cache_key(params) != before
+
+
+def test_load_discards_unreadable_entry(tmp_path):
+    """
+    Test that an entry failing to unpickle is treated as a miss and deleted.
+    """
+    bad = tmp_path / "bad.pkl"
+    # Pickle referencing a module that does not exist raises ModuleNotFoundError
+    bad.write_bytes(
+        b"\x80\x04\x95\x15\x00\x00\x00\x00\x00\x00\x00"
+        b"\x8c\x0bno_such_mod\x94\x8c\x01X\x94\x93\x94."
+    )
+    assert experiment_cache.load("bad") is None
+    assert not bad.exists()
+
+
+def test_store_prunes_oldest_disk_entries(tmp_path, monkeypatch):
+    """
+    Test that the disk cache stays within MAX_DISK_BYTES, dropping the oldest files.
+    """
+    monkeypatch.setattr(experiment_cache, "MAX_DISK_BYTES", 2500)
+    for i, key in enumerate(("a", "b", "c")):
+        experiment_cache.store(key, bytes(1000))
+        os.utime(tmp_path / f"{key}.pkl", (i, i))
+    experiment_cache.store("d", bytes(1000))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["c.pkl", "d.pkl"]
+
+
+def test_memory_cache_is_bounded(monkeypatch):
+    """
+    Test that the in-memory cache evicts its oldest entries beyond MAX_MEMORY_BYTES.
+    """
+    monkeypatch.setattr(experiment_cache, "MAX_MEMORY_BYTES", 2500)
+    for key in ("a", "b", "c"):
+        experiment_cache.store(key, bytes(1000))
+    assert list(experiment_cache._memory_cache) == ["b", "c"]
+
+
+def test_store_skips_oversized_entries(tmp_path, monkeypatch):
+    """
+    Test that results larger than MAX_ENTRY_BYTES are not cached in either layer.
+    """
+    monkeypatch.setattr(experiment_cache, "MAX_ENTRY_BYTES", 500)
+    experiment_cache.store("big", bytes(1000))
+    assert experiment_cache.load("big") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_clear_removes_memory_and_disk(tmp_path):
+    """
+    Test that clear() empties both cache layers.
+    """
+    experiment_cache.store("abc", 1)
+    assert experiment_cache.clear() == 1
+    assert experiment_cache._memory_cache == {}
+    assert list(tmp_path.iterdir()) == []
@@ -106,3 +106,55 @@ def test_prompt_yes_no_default(input_handler):
         result = input_handler.prompt_yes_no("custom_error_rate_prompt", "n")
         assert result is False  # Default "n" maps to False
         input_handler.console.print.assert_called()
+
+
+def test_get_input_missing_prompt_key(input_handler):
+    """
+    Test get_input falls back to a warning prompt for an unknown message key.
+    """
+    with patch("builtins.input", return_value=""):
+        result = input_handler.get_input("no_such_prompt", "s")
+        assert result == "s"
+        input_handler.console.print.assert_called_once_with(
+            "[bold red]Missing prompt for key: no_such_prompt[/bold red]", end=""
+        )
+
+
+def test_get_input_free_skips_validation(input_handler):
+    """
+    Test get_input_free accepts any input, keeps its case, and renders the prompt once.
+    """
+    with patch("builtins.input", return_value=" Plots/Out.png "):
+        result = input_handler.get_input_free("save_plot_prompt", "")
+        assert result == "Plots/Out.png"
+        input_handler.console.print.assert_called_once()
+
+
+def test_get_numeric_input_retry_reprompts(input_handler):
+    """
+    Test get_numeric_input with retry re-prompts until the input is numeric.
+    """
+    with patch("builtins.input", side_effect=["invalid", "5"]):
+        result = input_handler.get_numeric_input("shots_prompt", "1024", int, retry=True)
+        assert result == 5
+
+
+def test_get_input_validated_uses_validator(input_handler):
+    """
+    Test get_input_validated matches options through InputValidator.validate_choice.
+    """
+    with patch.object(
+        input_handler.validator, "validate_choice", side_effect=[False, True]
+    ) as validate_choice:
+        with patch("builtins.input", side_effect=["x", "N"]):
+            result = input_handler.get_input_validated("your_choice", "s", ["S", "N"])
+        assert result == "n"
+        validate_choice.assert_called_with("n", ["S", "N"])
+
+
+def test_get_input_without_options_still_lowercases(input_handler):
+    """
+    Test get_input keeps its lowercase contract when no options are given.
+    """
+    with patch("builtins.input", return_value="MiXeD"):
+        assert input_handler.get_input("save_plot_prompt", "") == "mixed"
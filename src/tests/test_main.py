@@ -0,0 +1,79 @@
+# src/tests/test_main.py
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def main_module(monkeypatch):
+    """
+    Fixture to import main without switching to its interactive TkAgg backend.
+    """
+    import matplotlib
+
+    monkeypatch.setattr(matplotlib, "use", lambda *args, **kwargs: None)
+    import main
+
+    monkeypatch.setattr(main, "_last_validated_hash", None)
+    return main
+
+
+def test_validate_and_prompt_skips_checks_for_same_args(main_module, base_params):
+    """
+    Test that revalidating identical parameters skips the interactive checks.
+    """
+    with patch.object(
+        main_module, "_validate_and_prompt", side_effect=lambda args: args
+    ) as checks:
+        main_module.validate_and_prompt(dict(base_params))
+        main_module.validate_and_prompt(dict(base_params))
+        assert checks.call_count == 1
+
+
+def test_validate_and_prompt_rechecks_changed_args(main_module, base_params):
+    """
+    Test that a changed parameter set goes through the checks again.
+    """
+    with patch.object(
+        main_module, "_validate_and_prompt", side_effect=lambda args: args
+    ) as checks:
+        main_module.validate_and_prompt(dict(base_params))
+        main_module.validate_and_prompt({**base_params, "num_qubits": 4})
+        assert checks.call_count == 2
+
+
+def test_forget_validated_args_rechecks_same_args(main_module, base_params):
+    """
+    Test that discarded parameters show their checks again when re-entered.
+    """
+    with patch.object(
+        main_module, "_validate_and_prompt", side_effect=lambda args: args
+    ) as checks:
+        main_module.validate_and_prompt(dict(base_params))
+        main_module._forget_validated_args()
+        main_module.validate_and_prompt(dict(base_params))
+        assert checks.call_count == 2
+
+
+def test_offer_pending_runs_runs_queue_on_yes(main_module, base_params):
+    """
+    Test that leaving the rerun loop runs queued experiments when the user agrees.
+    """
+    pending = [dict(base_params)]
+    with patch.object(main_module, "run_batch") as run_batch, patch(
+        "builtins.input", return_value="y"
+    ):
+        main_module._offer_pending_runs(pending)
+    run_batch.assert_called_once_with(pending)
+
+
+def test_offer_pending_runs_warns_on_no(main_module, base_params):
+    """
+    Test that declining reports how many queued runs are discarded.
+    """
+    with patch.object(main_module, "run_batch") as run_batch, patch.object(
+        main_module, "print_message"
+    ) as print_message, patch("builtins.input", return_value="n"):
+        main_module._offer_pending_runs([dict(base_params), dict(base_params)])
+    run_batch.assert_not_called()
+    print_message.assert_called_once_with("batch_discarded", count=2)
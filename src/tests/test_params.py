@@ -205,3 +205,25 @@ def test_validate_parameters_density_noise_warning(base_params, mock_console):
             "No noise will be applied with this configuration. Noise will be disabled to proceed. "
             "Consider using multi-qubit noise types (e.g., DEPOLARIZING, PHASE_FLIP, THERMAL_RELAXATION) for density mode.[/bold yellow]"
         )
+
+
+def test_apply_defaults_returns_independent_copies():
+    """Test apply_defaults returns a fresh dict on repeated calls."""
+    first = apply_defaults({"custom_params": {"lattice": "1d"}})
+    first["num_qubits"] = 7
+    first["custom_params"]["lattice"] = "2d"
+    second = apply_defaults({"custom_params": {"lattice": "1d"}})
+    assert second["num_qubits"] == 3
+    assert second["custom_params"] == {"lattice": "1d"}
+
+
+def test_validate_parameters_repeats_warning_on_repeated_call(base_params, mock_console):
+    """Test validate_parameters prints warnings again for identical parameters."""
+    with patch("src.config.params.console.print", mock_console):
+        base_params["noise_type"] = "AMPLITUDE_DAMPING"
+        base_params["num_qubits"] = 4
+        first = validate_parameters(base_params)
+        second = validate_parameters(base_params)
+        assert first == second
+        assert first is not second
+        assert mock_console.call_count == 2
@@ -0,0 +1,82 @@
+# src/tests/test_run_experiment.py
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+from src.run_experiment import run_experiment_batch
+
+
+def test_run_experiment_batch_keeps_per_run_shots():
+    """
+    Test that batched qasm runs each report their own shot count, in input order.
+    """
+    runs = [
+        {"num_qubits": 2, "noise_enabled": False, "shots": shots, "experiment_id": f"run{shots}"}
+        for shots in (50, 10, 30)
+    ]
+    outputs = run_experiment_batch(runs)
+    assert [sum(result["counts"].values()) for _, result in outputs] == [50, 10, 30]
+    for _, result in outputs:
+        # Noiseless GHZ only produces the all-zeros and all-ones outcomes
+        assert set(result["counts"]) <= {"00", "11"}
+
+
+def test_run_experiment_batch_mixed_modes():
+    """
+    Test that runs with different parameters are grouped and returned in order.
+    """
+    runs = [
+        {"num_qubits": 2, "sim_mode": "density", "noise_enabled": False},
+        {"num_qubits": 3, "noise_enabled": False, "shots": 20},
+    ]
+    (_, density), (_, qasm) = run_experiment_batch(runs)
+    assert np.allclose(density.data[[0, 0, 3, 3], [0, 3, 0, 3]], 0.5)
+    assert sum(qasm["counts"].values()) == 20
+
+
+@pytest.mark.parametrize("shots", [-5, 0, 2.5])
+def test_run_experiment_batch_rejects_invalid_shots(shots):
+    """
+    Test that a batch with a non-positive or non-integer shot count is rejected up front.
+    """
+    runs = [
+        {"num_qubits": 2, "noise_enabled": False, "shots": 100},
+        {"num_qubits": 2, "noise_enabled": False, "shots": shots},
+    ]
+    with patch("src.run_experiment._simulate") as simulate:
+        with pytest.raises(ValueError, match="shots must be an integer >= 1"):
+            run_experiment_batch(runs)
+        simulate.assert_not_called()
+
+
+def test_run_experiment_batch_slices_one_submission():
+    """
+    Test that a qasm group is simulated once for the total shots, not per run at the maximum.
+    """
+    from src.run_experiment import _simulate
+
+    runs = [{"num_qubits": 2, "noise_enabled": False, "shots": s} for s in (40, 5, 5)]
+    with patch("src.run_experiment._simulate", wraps=_simulate) as simulate:
+        outputs = run_experiment_batch(runs)
+    simulate.assert_called_once()
+    assert simulate.call_args.args[2] == 50
+    assert [sum(result["counts"].values()) for _, result in outputs] == [40, 5, 5]
+
+
+def test_run_experiment_batch_noisy_density_runs_are_independent():
+    """
+    Test that noisy density runs each get their own simulated trajectory.
+    """
+    runs = [
+        {
+            "num_qubits": 2,
+            "sim_mode": "density",
+            "noise_type": "DEPOLARIZING",
+            "error_rate": 0.5,
+            "experiment_id": f"run{i}",
+        }
+        for i in range(8)
+    ]
+    outputs = run_experiment_batch(runs)
+    matrices = {np.round(result.data, 6).tobytes() for _, result in outputs}
+    assert len(matrices) > 1
@@ -0,0 +1,68 @@
+# tests/test_serialization.py
+
+import json
+import numpy as np
+import pytest
+from src.utils import serialization
+from src.utils.results import encode_complex
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """
+    Fixture to run a test against orjson (when installed) and the stdlib fallback.
+    """
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_loads_parses_json(backend):
+    """
+    Test loads decodes a JSON object.
+    """
+    assert serialization.loads('{"t1": 50.0, "gates": ["id", "u3"]}') == {
+        "t1": 50.0,
+        "gates": ["id", "u3"],
+    }
+
+
+def test_loads_invalid_raises_json_decode_error(backend):
+    """
+    Test loads raises json.JSONDecodeError on invalid input with either backend.
+    """
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads("{not json")
+
+
+def test_dump_to_file_complex_arrays(backend, tmp_path):
+    """
+    Test dump_to_file writes complex NumPy arrays and scalars through the default hook.
+    """
+    path = tmp_path / "result.json"
+    data = {
+        "density_matrix": np.array([[0.5, 0.5j], [-0.5j, 0.5]]),
+        "probabilities": np.array([0.25, 0.75]),
+        "phase": 1j,
+    }
+    serialization.dump_to_file(data, str(path), default=encode_complex)
+    with open(path) as f:
+        loaded = json.load(f)
+    assert loaded["density_matrix"] == [
+        [{"real": 0.5, "imag": 0.0}, {"real": 0.0, "imag": 0.5}],
+        [{"real": 0.0, "imag": -0.5}, {"real": 0.5, "imag": 0.0}],
+    ]
+    assert loaded["probabilities"] == [0.25, 0.75]
+    assert loaded["phase"] == {"real": 0.0, "imag": 1.0}
+
+
+def test_dump_to_file_unsupported_type_raises(backend, tmp_path):
+    """
+    Test dump_to_file raises TypeError for objects the default hook rejects.
+    """
+    with pytest.raises(TypeError):
+        serialization.dump_to_file(
+            {"value": object()}, str(tmp_path / "bad.json"), default=encode_complex
+        )
@@ -1,7 +1,8 @@
 # tests/test_validation.py
 
+import math
 import pytest
-from src.utils.validation import InputValidator, validate_inputs
+from src.utils.validation import InputValidator, _option_set, validate_inputs
 
 
 def test_validate_choice_valid():
@@ -30,6 +31,18 @@ def test_validate_choice_case_sensitive():
     assert validator.validate_choice("s", ["s", "n", "q"], case_sensitive=True) is True
 
 
+def test_validate_choice_reuses_option_set():
+    """
+    Test repeated validate_choice calls with the same options build the option set once.
+    """
+    validator = InputValidator()
+    _option_set.cache_clear()
+    for answer in ("s", "N", "x"):
+        validator.validate_choice(answer, ["s", "n", "q"])
+    info = _option_set.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
 def test_validate_choice_no_options():
     """
     Test validate_choice with no valid options.
@@ -62,6 +75,25 @@ def test_validate_numeric_invalid():
     assert validator.validate_numeric("invalid", int) is None
 
 
+def test_validate_numeric_matches_constructor_forms():
+    """
+    Test validate_numeric still accepts every form int()/float() accept.
+    """
+    validator = InputValidator()
+    assert validator.validate_numeric("+5", int) == 5
+    assert validator.validate_numeric("1_000", int) == 1000
+    assert validator.validate_numeric("1e-3", float) == 0.001
+    assert validator.validate_numeric("inf", float) == float("inf")
+    assert validator.validate_numeric("--5", int) is None
+    assert validator.validate_numeric("1.5", int) is None
+    assert validator.validate_numeric("inf", int) is None
+    assert validator.validate_numeric(" 7\n", int) == 7
+    assert math.isnan(validator.validate_numeric("nan ", float))
+    assert validator.validate_numeric(" inf", float) == float("inf")
+    assert validator.validate_numeric("\t-infinity", float) == float("-inf")
+    assert validator.validate_numeric(" x ", float) is None
+
+
 def test_validate_yes_no_yes():
     """
     Test validate_yes_no with yes inputs.
@@ -148,3 +180,40 @@ def test_validate_inputs_invalid_sim_mode():
             noise_type="DEPOLARIZING",
             sim_mode="invalid",
         )
+
+
+def test_validate_inputs_phase_flip_requires_both_probs():
+    """
+    Test validate_inputs rejects a PHASE_FLIP config with only one probability.
+    """
+    with pytest.raises(ValueError, match="Both z_prob and i_prob"):
+        validate_inputs(
+            num_qubits=3,
+            state_type="GHZ",
+            noise_type="PHASE_FLIP",
+            sim_mode="qasm",
+            z_prob=0.5,
+        )
+
+
+def test_validate_inputs_thermal_checks_only_thermal_noise():
+    """
+    Test T1/T2 constraints apply to THERMAL_RELAXATION noise only.
+    """
+    with pytest.raises(ValueError, match="T2 <= T1"):
+        validate_inputs(
+            num_qubits=3,
+            state_type="GHZ",
+            noise_type="THERMAL_RELAXATION",
+            sim_mode="qasm",
+            t1=50,
+            t2=80,
+        )
+    validate_inputs(
+        num_qubits=3,
+        state_type="GHZ",
+        noise_type="DEPOLARIZING",
+        sim_mode="qasm",
+        t1=50,
+        t2=80,
+    )  # Should not raise any exception
@@ -1,6 +1,7 @@
 import argparse
 import json
 import numpy as np
+from src.utils import serialization
 from src.config import (
     DEFAULT_NUM_QUBITS,
     DEFAULT_STATE_TYPE,
@@ -123,7 +124,7 @@ def parse_args() -> argparse.Namespace:
     # Parse custom_params as JSON if provided.
     if args.custom_params:
         try:
-            args.custom_params = json.loads(args.custom_params)
+            args.custom_params = serialization.loads(args.custom_params)
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON format for --custom_params.")
 
@@ -0,0 +1,214 @@
+# src/utils/experiment_cache.py
+
+"""
+Content-addressed cache for deterministic experiment results.
+
+Results are keyed by a hash of the canonicalized experiment parameters, salted with
+the cache schema and Qiskit versions, and kept both in memory and as pickle files
+under `cache/experiments`, so identical runs are reused within a session and across
+sessions. Density matrices grow as 4^n, so both layers are bounded by total pickled
+bytes and results larger than MAX_ENTRY_BYTES are not cached; clear() empties both.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+import qiskit
+import qiskit_aer
+
+logger = logging.getLogger("QuantumExperiment.Utils")
+
+CACHE_DIR = os.path.join("cache", "experiments")
+
+# Bump when the cached value layout or the code producing it changes
+CACHE_SCHEMA_VERSION = 1
+
+# Size limits in pickled bytes; oldest entries are evicted beyond the totals, and
+# larger results (about 10+ qubits of density matrix) are never cached
+MAX_ENTRY_BYTES = 16 * 1024 * 1024
+MAX_MEMORY_BYTES = 64 * 1024 * 1024
+MAX_DISK_BYTES = 512 * 1024 * 1024
+
+# Mixed into every key so entries from other code or library versions are never served
+_KEY_SALT = f"{CACHE_SCHEMA_VERSION}:{qiskit.__version__}:{qiskit_aer.__version__}"
+
+# key -> (value, pickled size in bytes), oldest first
+_memory_cache: Dict[str, Tuple[Any, int]] = {}
+
+
+def is_cacheable(params: Dict[str, Any]) -> bool:
+    """
+    Checks whether an experiment is deterministic and therefore safe to cache.
+
+    Qasm runs sample measurement shots and noisy runs sample noise trajectories, so
+    only noiseless density-matrix simulations are cached.
+
+    Args:
+        params (Dict[str, Any]): Experiment parameters passed to run_experiment.
+
+    Returns:
+        bool: True if the result can be reused for identical parameters.
+    """
+    return params.get("sim_mode") == "density" and not params.get("noise_enabled")
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    """
+    Computes the content hash for a set of experiment parameters.
+
+    Args:
+        params (Dict[str, Any]): Experiment parameters; experiment_id is ignored.
+
+    Returns:
+        str: Hex digest identifying the parameters and the cache/library versions.
+    """
+    canonical = {k: v for k, v in params.items() if k != "experiment_id"}
+    encoded = (_KEY_SALT + json.dumps(canonical, sort_keys=True, default=str)).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def load(key: str) -> Optional[Any]:
+    """
+    Looks up a cached result, checking memory first and then disk.
+
+    Args:
+        key (str): Key from cache_key().
+
+    Returns:
+        Optional[Any]: The cached value, or None on a miss.
+    """
+    if key in _memory_cache:
+        return _memory_cache[key][0]
+    path = os.path.join(CACHE_DIR, f"{key}.pkl")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        value = pickle.loads(data)
+    except Exception as e:
+        # Unpickling can fail in many ways (truncated files, moved or changed
+        # classes); a bad entry is a miss, and is deleted so it is rebuilt
+        logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+        _remove(path)
+        return None
+    _remember(key, value, len(data))
+    return value
+
+
+def store(key: str, value: Any) -> None:
+    """
+    Stores a result in memory and on disk, unless it exceeds MAX_ENTRY_BYTES.
+
+    Args:
+        key (str): Key from cache_key().
+        value (Any): Picklable value to cache.
+    """
+    try:
+        data = pickle.dumps(value)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning(f"Could not pickle cache entry {key}: {e}")
+        return
+    if len(data) > MAX_ENTRY_BYTES:
+        logger.debug(f"Not caching {key}: {len(data)} bytes exceeds {MAX_ENTRY_BYTES}")
+        return
+    _remember(key, value, len(data))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{key}.pkl")
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+    except OSError as e:
+        logger.warning(f"Could not write cache entry {path}: {e}")
+        return
+    _prune_disk()
+
+
+def clear() -> int:
+    """
+    Removes every cached result from memory and disk.
+
+    Returns:
+        int: Number of cache files deleted.
+    """
+    _memory_cache.clear()
+    removed = 0
+    for path in _entry_paths():
+        if _remove(path):
+            removed += 1
+    return removed
+
+
+def _remember(key: str, value: Any, size: int) -> None:
+    """
+    Adds a value to the in-memory cache, evicting the oldest entries beyond MAX_MEMORY_BYTES.
+    """
+    _memory_cache.pop(key, None)
+    _memory_cache[key] = (value, size)
+    total = sum(entry_size for _, entry_size in _memory_cache.values())
+    while total > MAX_MEMORY_BYTES and len(_memory_cache) > 1:
+        oldest = next(iter(_memory_cache))
+        total -= _memory_cache.pop(oldest)[1]
+
+
+def _entry_paths() -> List[str]:
+    """
+    Lists the cache files on disk.
+    """
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return []
+    return [os.path.join(CACHE_DIR, name) for name in names if name.endswith(".pkl")]
+
+
+def _prune_disk() -> None:
+    """
+    Deletes the least recently written cache files until the total is within MAX_DISK_BYTES.
+    """
+    paths = sorted(_entry_paths(), key=_mtime)
+    total = sum(_size(path) for path in paths)
+    for path in paths:
+        if total <= MAX_DISK_BYTES:
+            break
+        size = _size(path)
+        if _remove(path):
+            total -= size
+
+
+def _mtime(path: str) -> float:
+    """
+    Returns a file's modification time, or 0.0 if it cannot be read.
+    """
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def _size(path: str) -> int:
+    """
+    Returns a file's size in bytes, or 0 if it cannot be read.
+    """
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _remove(path: str) -> bool:
+    """
+    Deletes a cache file, ignoring files that are already gone.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.warning(f"Could not delete cache entry {path}: {e}")
+        return False
+    return True
@@ -2,6 +2,7 @@
 
 from typing import Optional, List, Union, Type
 from rich.console import Console
+from src.utils.messages import compile_messages
 from src.utils.validation import InputValidator
 
 
@@ -18,6 +19,7 @@ class InputHandler:
         """
         self.console = console
         self.messages = messages
+        self.templates = compile_messages(messages)
         self.validator = InputValidator()
 
     def get_input(
@@ -41,38 +43,95 @@ class InputHandler:
         Returns:
             str: User input or default, normalized to lowercase.
         """
+        if valid_options is None:
+            return self.get_input_free(prompt_key, default, **kwargs).lower()
+        return self.get_input_validated(
+            prompt_key, default, valid_options, valid_options_display, **kwargs
+        )
+
+    def get_input_free(self, prompt_key: str, default: str, **kwargs) -> str:
+        """
+        Gets free-form user input without option validation.
+
+        Case is preserved, since free-form answers include file paths and JSON.
+
+        Args:
+            prompt_key (str): The key for the prompt message in MESSAGES.
+            default (str): Default value if user presses Enter.
+            **kwargs: Additional values to format the prompt message with.
+
+        Returns:
+            str: User input or default, stripped of surrounding whitespace.
+        """
+        prompt = self._render_prompt(prompt_key, {"default": default, **kwargs})
+        try:
+            self.console.print(prompt, end="")
+            return input().strip() or default
+        except KeyboardInterrupt:
+            self.console.print(self.messages["operation_cancelled"])
+            return default
+
+    def get_input_validated(
+        self,
+        prompt_key: str,
+        default: str,
+        valid_options: List[str],
+        valid_options_display: Optional[List[str]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Gets user input, re-prompting until it matches one of the valid options.
+
+        Args:
+            prompt_key (str): The key for the prompt message in MESSAGES.
+            default (str): Default value if user presses Enter.
+            valid_options (list): List of valid options, compared case-insensitively.
+            valid_options_display (list, optional): List of options to display in the prompt.
+            **kwargs: Additional values to format the prompt message with.
+
+        Returns:
+            str: User input or default, normalized to lowercase.
+        """
+        format_kwargs = {
+            "default": default,
+            "valid_options": (
+                valid_options_display
+                if valid_options_display is not None
+                else valid_options
+            ),
+        }
+        format_kwargs.update(kwargs)
+        prompt = self._render_prompt(prompt_key, format_kwargs)
         while True:
             try:
-                prompt = self.messages.get(
-                    prompt_key,
-                    f"[bold red]Missing prompt for key: {prompt_key}[/bold red]",
-                )
-                format_kwargs = {"default": default}
-                if valid_options is not None:
-                    format_kwargs["valid_options"] = (
-                        valid_options_display
-                        if valid_options_display is not None
-                        else valid_options
-                    )
-                format_kwargs.update(kwargs)
-                self.console.print(prompt.format(**format_kwargs), end="")
+                self.console.print(prompt, end="")
                 user_input = input().strip().lower() or default.lower()
                 if self.validator.validate_choice(user_input, valid_options):
                     return user_input
                 self.console.print(
-                    self.messages["invalid_input"].format(
-                        input=user_input, options=valid_options
+                    self.templates["invalid_input"](
+                        {"input": user_input, "options": valid_options}
                     )
                 )
             except KeyboardInterrupt:
                 self.console.print(self.messages["operation_cancelled"])
                 return default.lower()
 
+    def _render_prompt(self, prompt_key: str, values: dict) -> str:
+        """
+        Renders a prompt template, or a warning prompt if the key is unknown.
+        """
+        render = self.templates.get(prompt_key)
+        if render is None:
+            return f"[bold red]Missing prompt for key: {prompt_key}[/bold red]"
+        return render(values)
+
     def get_numeric_input(
         self,
         prompt_key: str,
         default: str,
         expected_type: Type[Union[int, float]] = int,
+        retry: bool = False,
     ) -> Union[int, float]:
         """
         Prompts the user for a numeric input, handling errors gracefully.
@@ -81,23 +140,27 @@ class InputHandler:
             prompt_key (str): The key for the prompt message in MESSAGES.
             default (str): Default value as a string.
             expected_type (type): Expected type (int or float).
+            retry (bool): Re-prompt on invalid input instead of raising.
 
         Returns:
             Union[int, float]: The numeric value.
 
         Raises:
-            ValueError: If the input cannot be converted to the expected type.
+            ValueError: If the input cannot be converted to the expected type
+                and retry is False.
         """
         while True:
-            user_input = self.get_input(prompt_key, default)
+            user_input = self.get_input_free(prompt_key, default)
             value = self.validator.validate_numeric(user_input, expected_type)
             if value is not None:
                 return value
             self.console.print(
-                self.messages["invalid_input"].format(
-                    input=user_input, options=[expected_type.__name__]
+                self.templates["invalid_input"](
+                    {"input": user_input, "options": [expected_type.__name__]}
                 )
             )
+            if retry:
+                continue
             raise ValueError(
                 f"Invalid numeric input: {user_input}. Expected type: {expected_type.__name__}"
             )
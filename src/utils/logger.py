@@ -2,6 +2,7 @@
 
 import os
 import logging
+import logging.handlers
 import json
 from datetime import datetime
 from typing import Optional
@@ -98,6 +99,7 @@ def setup_logger(
     log_to_file: bool = True,
     log_to_console: bool = True,
     structured_log_file: Optional[str] = None,
+    buffer_capacity: Optional[int] = None,
 ) -> logging.Logger:
     """
     Configures logging with support for file, console, and structured JSON output.
@@ -107,6 +109,8 @@ def setup_logger(
         log_to_file (bool): Whether to log to a file.
         log_to_console (bool): Whether to log to the console.
         structured_log_file (str, optional): Path to a JSON file for structured logs.
+        buffer_capacity (int, optional): If set, file output is buffered in memory and
+            written every `buffer_capacity` records, on ERROR records, and at exit.
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -121,14 +125,24 @@ def setup_logger(
     # Create logger
     logger = logging.getLogger("QuantumExperiment")
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    for handler in logger.handlers:
+        handler.flush()  # Write out anything still buffered before replacing
     logger.handlers.clear()  # Clear any existing handlers
 
+    def buffered(handler: logging.Handler) -> logging.Handler:
+        if not buffer_capacity:
+            return handler
+        # logging.shutdown() flushes this before closing its target at exit
+        return logging.handlers.MemoryHandler(
+            buffer_capacity, flushLevel=logging.ERROR, target=handler
+        )
+
     # File handler (human-readable)
     handlers = []
     if log_to_file:
         file_handler = logging.FileHandler(log_filename)
         file_handler.setFormatter(StructuredFormatter(is_rich_handler=False))
-        handlers.append(file_handler)
+        handlers.append(buffered(file_handler))
 
     # Console handler with rich output
     if log_to_console:
@@ -140,7 +154,7 @@ def setup_logger(
     if structured_log_file:
         structured_handler = logging.FileHandler(structured_log_file)
         structured_handler.setFormatter(StructuredFormatter(is_rich_handler=False))
-        handlers.append(structured_handler)
+        handlers.append(buffered(structured_handler))
 
     # Add handlers to logger
     for handler in handlers:
@@ -2,6 +2,11 @@
 Centralized lookup table for console messages used in the Quantum Experiment Interactive Runner.
 """
 
+from string import Formatter
+from typing import Callable, Dict, Mapping
+
+MessageRenderer = Callable[[Mapping], str]
+
 MESSAGES = {
     # Welcome and main menu messages
     "welcome": "[bold green]🚀 Welcome to the Quantum Experiment Interactive Runner![/bold green]",
@@ -109,8 +114,55 @@ MESSAGES = {
     "rerun_choice_prompt": "Run again? (y/n) [{default}]: ",
     "rerun_same": "\n[bold blue]🔁 Rerunning with same parameters...[/bold blue]\n",
     "restart_params": "\n[bold blue]🆕 Restarting parameter selection...[/bold blue]\n",
-    "rerun_prompt": "\n➡️ Rerun? (r/same, n/new, q/quit) [{default}]: ",
+    "rerun_prompt": "\n➡️ Rerun? (r/same, n/new, b/queue batch run, x/run batch, q/quit) [{default}]: ",
+    "batch_shots_prompt": "Shots for the queued run [{default}]: ",
+    "batch_queued": "[bold blue]➕ Queued run with {shots} shots ({count} pending).[/bold blue]",
+    "batch_queued_density": "[bold blue]➕ Queued density run ({count} pending).[/bold blue]",
+    "batch_empty": "[bold yellow]No queued runs. Press 'b' to queue one first.[/bold yellow]",
+    "batch_running": "\n[bold blue]⚡ Running {count} queued experiments as one batch...[/bold blue]\n",
+    "batch_shots_invalid": "[bold red]Shots must be at least 1 (got {shots}).[/bold red]",
+    "batch_pending_prompt": "Run the {count} queued runs first? (y/n) [{default}]: ",
+    "batch_discarded": "[bold yellow]Discarded {count} queued runs.[/bold yellow]",
+    "batch_stepped_unsupported": "[bold yellow]Time-stepped runs cannot be queued; use 'r' to rerun them.[/bold yellow]",
     "running_step": "Running step {step} of {total}: error_rate={error_rate}, z_prob={z_prob}, i_prob={i_prob}, t1={t1}, t2={t2}",
+    "cache_cleared": "[bold green]🧹 Cleared {count} cached experiment results.[/bold green]",
     "params_discarded": "[bold yellow]Parameters discarded. Returning to prompt...[/bold yellow]",
     "goodbye": "\n[bold yellow]👋 Exiting Quantum Experiment Runner. Goodbye![/bold yellow]",
 }
+
+
+def compile_message(template: str) -> MessageRenderer:
+    """
+    Pre-parses a message template into a renderer taking a mapping of values.
+
+    Templates without replacement fields render to the constant string, so no
+    formatting work is done for them at call time.
+
+    Args:
+        template (str): Message template in str.format syntax.
+
+    Returns:
+        MessageRenderer: Callable that renders the template from a mapping.
+    """
+    has_fields = any(
+        field_name is not None for _, field_name, _, _ in Formatter().parse(template)
+    )
+    if not has_fields and "{" not in template and "}" not in template:
+        return lambda values: template
+    return template.format_map
+
+
+def compile_messages(messages: Dict[str, str]) -> Dict[str, MessageRenderer]:
+    """
+    Compiles every template in a messages lookup table.
+
+    Args:
+        messages (Dict[str, str]): Message templates keyed by message key.
+
+    Returns:
+        Dict[str, MessageRenderer]: Renderers keyed by message key.
+    """
+    return {key: compile_message(template) for key, template in messages.items()}
+
+
+COMPILED_MESSAGES = compile_messages(MESSAGES)
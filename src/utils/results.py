@@ -7,23 +7,25 @@ import logging
 from qiskit.quantum_info import DensityMatrix, partial_trace, state_fidelity
 from typing import Union, Dict, Any
 from datetime import datetime
+from src.utils.serialization import dump_to_file
 
 logger = logging.getLogger("QuantumExperiment.Utils")
 
 
-class ComplexEncoder(json.JSONEncoder):
-    """
-    Custom JSON encoder to handle complex numbers and NumPy arrays.
+def encode_complex(obj):
     """
+    Converts complex numbers and NumPy arrays into JSON-serializable values.
 
-    def default(self, obj):
-        if isinstance(obj, complex):
-            return {"real": obj.real, "imag": obj.imag}
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if isinstance(obj, np.complex128):
-            return {"real": obj.real, "imag": obj.imag}
-        return json.JSONEncoder.default(self, obj)
+    Raises:
+        TypeError: If the object is not supported.
+    """
+    if isinstance(obj, complex):
+        return {"real": obj.real, "imag": obj.imag}
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.complex128):
+        return {"real": obj.real, "imag": obj.imag}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def compute_fidelity(
@@ -106,8 +108,7 @@ def save_results(
         )
         result_data["results"]["expected_probabilities"] = expected_states
 
-        with open(full_filename, "w") as f:
-            json.dump(result_data, f, indent=4, cls=ComplexEncoder)
+        dump_to_file(result_data, full_filename, default=encode_complex)
         logger.info(
             f"Saved qasm results to {full_filename}",
             extra={"experiment_id": experiment_id},
@@ -141,8 +142,7 @@ def save_results(
         result_data["results"]["reduced_density_matrices"] = reduced_density_matrices
         result_data["results"]["raw_data_file"] = np_filename
 
-        with open(full_filename, "w") as f:
-            json.dump(result_data, f, indent=4, cls=ComplexEncoder)
+        dump_to_file(result_data, full_filename, default=encode_complex)
         logger.info(
             f"Saved density matrix results to {full_filename}",
             extra={"experiment_id": experiment_id},
@@ -0,0 +1,52 @@
+# src/utils/serialization.py
+
+"""
+JSON helpers that use orjson when it is installed and fall back to the stdlib json module.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(text: str) -> Any:
+    """
+    Parses a JSON string.
+
+    Args:
+        text (str): JSON document.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dump_to_file(
+    data: Any, path: str, default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """
+    Writes data to a JSON file with indentation.
+
+    Args:
+        data (Any): The value to serialize.
+        path (str): Output file path.
+        default (Callable, optional): Converts values the encoder cannot handle
+            natively; must raise TypeError for unsupported objects.
+    """
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=default, option=options))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=4, default=default)
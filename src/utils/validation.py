@@ -1,10 +1,23 @@
 # src/utils/validation.py
 
-import numpy as np
-from typing import Optional, List, Union, Type
+from functools import lru_cache
+from math import tau
+from typing import FrozenSet, Optional, List, Tuple, Union, Type
+from src.config.constants import VALID_SIM_MODES
 from src.state_preparation.state_constants import STATE_CLASSES
 from src.noise_models import NOISE_CLASSES
 
+# Accepted values, hoisted out of validate_inputs; *_MSG keep the error text unchanged
+_VALID_STATES = frozenset(STATE_CLASSES)
+_VALID_STATES_MSG = str(list(STATE_CLASSES))
+_VALID_NOISES = frozenset(NOISE_CLASSES)
+_VALID_NOISES_MSG = str(list(NOISE_CLASSES))
+_VALID_SIM_MODES = frozenset(VALID_SIM_MODES)
+_VALID_SIM_MODES_MSG = str(list(VALID_SIM_MODES))
+
+# Answers accepted as "yes" by InputValidator.validate_yes_no
+_YES_ANSWERS = frozenset(("y", "yes", "t", "true"))
+
 
 def validate_inputs(
     num_qubits: int,
@@ -24,53 +37,99 @@ def validate_inputs(
     if num_qubits < 1:
         raise ValueError("Number of qubits must be at least 1.")
 
-    valid_states = list(STATE_CLASSES.keys())
-    if state_type not in valid_states:
+    if state_type not in _VALID_STATES:
         raise ValueError(
-            f"Invalid state type: {state_type}. Choose from {valid_states}"
+            f"Invalid state type: {state_type}. Choose from {_VALID_STATES_MSG}"
         )
 
-    valid_noises = list(NOISE_CLASSES.keys())
-    if noise_type not in valid_noises:
+    if noise_type not in _VALID_NOISES:
         raise ValueError(
-            f"Invalid noise type: {noise_type}. Choose from {valid_noises}"
+            f"Invalid noise type: {noise_type}. Choose from {_VALID_NOISES_MSG}"
         )
 
-    if sim_mode not in ["qasm", "density"]:
+    if sim_mode not in _VALID_SIM_MODES:
         raise ValueError(
-            f"Invalid simulation mode: {sim_mode}. Choose from ['qasm', 'density']"
+            f"Invalid simulation mode: {sim_mode}. Choose from {_VALID_SIM_MODES_MSG}"
         )
 
-    if state_type == "CLUSTER" and angle is not None:
-        if not (0 <= angle <= 2 * np.pi):
-            raise ValueError(
-                "Angle for CLUSTER state must be between 0 and 2π radians."
-            )
+    state_check = _STATE_VALIDATORS.get(state_type)
+    if state_check is not None:
+        state_check(angle=angle)
 
     if error_rate is not None and not (0 <= error_rate <= 1):
         raise ValueError("Error rate must be between 0 and 1.")
 
-    if noise_type == "PHASE_FLIP" and (z_prob is not None or i_prob is not None):
-        if z_prob is None or i_prob is None:
-            raise ValueError(
-                "Both z_prob and i_prob must be provided for PHASE_FLIP noise."
-            )
-        if not (
-            0 <= z_prob <= 1 and 0 <= i_prob <= 1 and abs(z_prob + i_prob - 1) < 1e-10
-        ):
-            raise ValueError(
-                "Z and I probabilities for PHASE_FLIP must sum to 1 and be between 0 and 1."
-            )
-
-    if noise_type == "THERMAL_RELAXATION" and (t1 is not None or t2 is not None):
-        if t1 is None or t2 is None:
-            raise ValueError(
-                "Both t1 and t2 must be provided for THERMAL_RELAXATION noise."
-            )
-        if t1 <= 0 or t2 <= 0 or t2 > t1:
-            raise ValueError(
-                "T1 and T2 must be positive, with T2 <= T1 for realistic relaxation."
-            )
+    # Most noise types take no extra parameters, so there is nothing left to check
+    noise_check = _NOISE_VALIDATORS.get(noise_type)
+    if noise_check is None:
+        return
+    noise_check(z_prob=z_prob, i_prob=i_prob, t1=t1, t2=t2)
+
+
+def _check_cluster(angle: Optional[float] = None, **_) -> None:
+    """
+    Checks the CLUSTER state rotation angle, if given.
+    """
+    if angle is not None and not (0.0 <= angle <= tau):
+        raise ValueError(
+            "Angle for CLUSTER state must be between 0 and 2π radians."
+        )
+
+
+def _check_phase_flip(
+    z_prob: Optional[float] = None, i_prob: Optional[float] = None, **_
+) -> None:
+    """
+    Checks PHASE_FLIP Z/I probabilities, if either is given.
+    """
+    if z_prob is None and i_prob is None:
+        return
+    if z_prob is None or i_prob is None:
+        raise ValueError(
+            "Both z_prob and i_prob must be provided for PHASE_FLIP noise."
+        )
+    if not (
+        0 <= z_prob <= 1 and 0 <= i_prob <= 1 and abs(z_prob + i_prob - 1) < 1e-10
+    ):
+        raise ValueError(
+            "Z and I probabilities for PHASE_FLIP must sum to 1 and be between 0 and 1."
+        )
+
+
+def _check_thermal_relaxation(
+    t1: Optional[float] = None, t2: Optional[float] = None, **_
+) -> None:
+    """
+    Checks THERMAL_RELAXATION T1/T2 times, if either is given.
+    """
+    if t1 is None and t2 is None:
+        return
+    if t1 is None or t2 is None:
+        raise ValueError(
+            "Both t1 and t2 must be provided for THERMAL_RELAXATION noise."
+        )
+    if t1 <= 0 or t2 <= 0 or t2 > t1:
+        raise ValueError(
+            "T1 and T2 must be positive, with T2 <= T1 for realistic relaxation."
+        )
+
+
+# Type-specific checks run by validate_inputs; other types have no extra constraints
+_STATE_VALIDATORS = {"CLUSTER": _check_cluster}
+_NOISE_VALIDATORS = {
+    "PHASE_FLIP": _check_phase_flip,
+    "THERMAL_RELAXATION": _check_thermal_relaxation,
+}
+
+
+@lru_cache(maxsize=32)
+def _option_set(options: Tuple[str, ...], case_sensitive: bool) -> FrozenSet[str]:
+    """
+    Builds the membership set for a tuple of options, lowercased unless case-sensitive.
+    """
+    if case_sensitive:
+        return frozenset(options)
+    return frozenset(opt.lower() for opt in options)
 
 
 class InputValidator:
@@ -97,8 +156,7 @@ class InputValidator:
             return True
         if not case_sensitive:
             user_input = user_input.lower()
-            valid_options = [opt.lower() for opt in valid_options]
-        return user_input in valid_options
+        return user_input in _option_set(tuple(valid_options), case_sensitive)
 
     @staticmethod
     def validate_numeric(
@@ -130,4 +188,4 @@ class InputValidator:
         Returns:
             bool: True if yes, False if no or invalid.
         """
-        return user_input.lower() in ["y", "yes", "t", "true"]
+        return user_input.lower() in _YES_ANSWERS
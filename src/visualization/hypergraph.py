@@ -7,12 +7,10 @@ import matplotlib.cm as cm
 import matplotlib.colors as mcolors
 import numpy as np
 import networkx as nx
-import hypernetx as hnx
 from typing import Optional, Dict, List, Union, Callable
 from itertools import combinations
 from qiskit.quantum_info import partial_trace, Pauli, DensityMatrix
 from scipy.spatial import ConvexHull
-from sklearn.cluster import KMeans  # For clustering
 from scipy.linalg import sqrtm  # For computing matrix square roots
 
 logger = logging.getLogger("QuantumExperiment.Visualization")
@@ -73,7 +71,7 @@ def compute_pairwise_correlations(
                 correlations[(i, j)] = zz_corr
     else:
         # Convert the NumPy array to a DensityMatrix object
-        density_matrix = DensityMatrix(np.array(correlation_data["density"]))
+        density_matrix = DensityMatrix(np.asarray(correlation_data["density"]))
         pauli_z = Pauli("Z").to_matrix()
         for i in range(num_qubits):
             for j in range(i + 1, num_qubits):
@@ -113,6 +111,9 @@ def cluster_qubits(
     num_clusters = min(num_clusters, num_qubits)  # Ensure num_clusters <= num_qubits
     if num_clusters < 1:
         return [[i for i in range(num_qubits)]]  # Single cluster with all qubits
+    # Deferred: scikit-learn is slow to import and only needed here
+    from sklearn.cluster import KMeans
+
     kmeans = KMeans(n_clusters=num_clusters, random_state=42)
     labels = kmeans.fit_predict(features)
 
@@ -284,7 +285,9 @@ def compute_correlations(
     edges = {}
     edge_id = 0
     shots = sum(correlation_data.values()) if mode == "qasm" else 1
-    threshold = config.get("threshold", 0.1 if mode == "qasm" else 0.01)
+    threshold = config.get("threshold")
+    if threshold is None:  # plot_hypergraph defaults the key to None
+        threshold = 0.1 if mode == "qasm" else 0.01
     max_order = config.get("max_order", 2)
 
     if mode == "qasm":
@@ -304,20 +307,21 @@ def compute_correlations(
             raise KeyError(
                 "Expected 'density' key in correlation_data for density mode"
             )
-        density_matrix = np.array(correlation_data["density"])
-        for i in range(density_matrix.shape[0]):
-            for j in range(i + 1, density_matrix.shape[1]):
-                corr = abs(density_matrix[i, j])
-                if corr > threshold:
-                    bitstring_i = format(i, f"0{num_qubits}b")
-                    bitstring_j = format(j, f"0{num_qubits}b")
-                    differing_qubits = [
-                        k for k in range(num_qubits) if bitstring_i[k] != bitstring_j[k]
-                    ]
-                    if len(differing_qubits) >= 2:
-                        edge_nodes = frozenset([f"q{k}" for k in differing_qubits])
-                        edges[f"e{edge_id}"] = (edge_nodes, {"weight": corr})
-                        edge_id += 1
+        abs_density = np.abs(np.asarray(correlation_data["density"]))
+        # Only the strict upper triangle above threshold can produce edges
+        mask = np.triu(abs_density > threshold, k=1)
+        coords = np.argwhere(mask)
+        weights = abs_density[mask]
+        for (i, j), corr in zip(coords, weights):
+            # Qubit k is the k-th character of the basis bitstring (MSB first)
+            diff = int(i) ^ int(j)
+            differing_qubits = [
+                k for k in range(num_qubits) if diff >> (num_qubits - 1 - k) & 1
+            ]
+            if len(differing_qubits) >= 2:
+                edge_nodes = frozenset([f"q{k}" for k in differing_qubits])
+                edges[f"e{edge_id}"] = (edge_nodes, {"weight": corr})
+                edge_id += 1
     return edges
 
 
@@ -334,7 +338,7 @@ def plot_hypergraph(
     Plots a hypergraph of quantum state correlations with enhanced scientific visualization.
 
     Args:
-        correlation_data: The data to plot (counts or density matrix).
+        correlation_data: The data to plot (counts, or {"density": np.ndarray} for density mode).
         state_type: The type of quantum state.
         noise_type: The type of noise applied.
         save_path: Path to save the plot, if any.
@@ -364,8 +368,8 @@ def plot_hypergraph(
                 "density" in correlation_data[i]
                 and "density" in correlation_data[i + 1]
             ):
-                rho1 = np.array(correlation_data[i]["density"])
-                rho2 = np.array(correlation_data[i + 1]["density"])
+                rho1 = np.asarray(correlation_data[i]["density"])
+                rho2 = np.asarray(correlation_data[i + 1]["density"])
                 distance = compute_fubini_study_distance(rho1, rho2)
                 fs_distances.append(distance)
             else:
@@ -380,7 +384,7 @@ def plot_hypergraph(
             bloch_vectors = []
             for data in correlation_data:
                 if "density" in data:
-                    density_matrix = DensityMatrix(np.array(data["density"]))
+                    density_matrix = DensityMatrix(np.asarray(data["density"]))
                     num_qubits = int(np.log2(density_matrix.dim))
                     qubit_bloch = {}
                     for qubit in range(num_qubits):
@@ -510,7 +514,7 @@ def plot_single_hypergraph(
                 f"Expected a dictionary with 'density' key for density mode, got {correlation_data}"
             )
         # Convert to DensityMatrix object
-        density_matrix = DensityMatrix(np.array(correlation_data["density"]))
+        density_matrix = DensityMatrix(np.asarray(correlation_data["density"]))
         num_qubits = int(np.log2(density_matrix.dim))
         shots = 1.0  # Default for density mode, as shots aren't used
     else:
@@ -557,7 +561,9 @@ def plot_single_hypergraph(
         ax_analysis = fig.add_subplot(gs[1, 0])
         ax_analysis.set_axis_off()
 
-        # Create a Hypernetx hypergraph
+        # Create a Hypernetx hypergraph (deferred import: hypernetx is slow to load)
+        import hypernetx as hnx
+
         Hedges = {
             frozenset(edge_nodes): frozenset(edge_nodes)
             for edge_key, (edge_nodes, _) in edges.items()
@@ -5,7 +5,6 @@ from qiskit.quantum_info import DensityMatrix
 import numpy as np
 import matplotlib.pyplot as plt
 from src.visualization import Visualizer
-from src.visualization.hypergraph import plot_hypergraph
 from src.utils import logger as logger_utils
 
 logger = logger_utils.setup_logger(
@@ -146,11 +145,11 @@ def handle_visualization(
                         raise ValueError(
                             f"Expected a DensityMatrix object for density mode, got {type(res)}"
                         )
-                    correlation_data.append({"density": res.data.tolist()})
+                    correlation_data.append({"density": res.data})
             logger.info(
                 f"Preparing hypergraph visualization with {len(correlation_data)} timesteps"
             )
-            plot_closed_with_ctrl_c = not plot_hypergraph(
+            plot_closed_with_ctrl_c = not Visualizer.plot_hypergraph(
                 correlation_data,
                 state_type=state_type,
                 noise_type=noise_type if noise_enabled else None,
@@ -234,10 +233,10 @@ def handle_visualization(
                     raise ValueError(
                         f"Expected a DensityMatrix object for density mode, got {type(result)}"
                     )
-                correlation_data = {"density": result.data.tolist()}
+                correlation_data = {"density": result.data}
 
             logger.info("Preparing hypergraph visualization for single result")
-            plot_closed_with_ctrl_c = not plot_hypergraph(
+            plot_closed_with_ctrl_c = not Visualizer.plot_hypergraph(
                 correlation_data,
                 state_type=state_type,
                 noise_type=noise_type if noise_enabled else None,